@@ -1,14 +1,29 @@
 import logging
 from mysql.connector import connect
-import pandas as pd
 import re
-from flask import Flask, render_template, request, flash, url_for, redirect, make_response
+from flask import Flask, render_template, get_template_attribute, request, flash, url_for, redirect, make_response, jsonify, Response, session, g
 from urllib.parse import urlparse
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 import bcrypt
+import concurrent.futures
+import multiprocessing
 from functools import wraps
+import contextlib
+from contextlib import contextmanager
+from collections import OrderedDict
 import datetime
+import json
+import csv
+import io
+import hashlib
+import bisect
+import heapq
+import itertools
 import os
+import sys
+import queue
+import threading
+import time
 
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -16,18 +31,7 @@ from email.mime.application import MIMEApplication
 import smtplib
 
 
-def send_mail(
-        distribution_list, 
-        email_subject, 
-        sender_address, 
-        smtp_server, 
-        smtp_server_user,
-        smtp_server_port,
-        smtp_server_password,
-        body,
-        file_buffer=None, 
-        output_file_name=None
-        ):
+def build_mail_message(distribution_list, email_subject, sender_address, body, file_buffer=None, output_file_name=None):
     msg = MIMEMultipart('alternative')
     msg['From'] = sender_address
     msg['To'] = ';'.join(distribution_list)
@@ -38,16 +42,212 @@ def send_mail(
         part = MIMEApplication(file_buffer.getvalue(), Name=output_file_name)
         part['Content-Disposition'] = f'attachment; filename="{output_file_name}"' 
         msg.attach(part)
+    return msg
 
-    with smtplib.SMTP(smtp_server, smtp_server_port) as smtp:
-        smtp.login(smtp_server_user, smtp_server_password)
-        smtp.sendmail(sender_address, distribution_list, msg.as_string())
+
+def is_dropped_smtp_session(error):
+    """Whether an SMTP error means the session is gone and the message can be retried on a new one."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        # 421: the server is closing the session, e.g. after its per-connection message limit.
+        return error.smtp_code == 421
+    return isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError))
+
+
+def is_permanent_smtp_failure(error):
+    """Whether retrying a message cannot help: every recipient was refused or its DATA got a 5xx."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPDataError) and 500 <= error.smtp_code < 600
+
+
+class MailSessionError(Exception):
+    """Raised when the SMTP session cannot be opened or used: the server refused the connection,
+    the login or the sender address, or kept dropping the session. Every other message on the
+    session would fail the same way, so it is not the message's fault.
+    """
+
+
+class MailTransport:
+    """One authenticated SMTP session reused for a batch of messages, e.g. a weekly summary run.
+
+    The session is opened on the first send and reopened once per message if the server
+    drops it. Leaving the `with` block closes the session and logs report().
+    """
+
+    def __init__(self, logger, run_name, smtp_server, smtp_server_port, smtp_server_user, smtp_server_password, timeout=30):
+        self._logger = logger
+        self._run_name = run_name
+        self._smtp_server = smtp_server
+        self._smtp_server_port = smtp_server_port
+        self._smtp_server_user = smtp_server_user
+        self._smtp_server_password = smtp_server_password
+        self._timeout = timeout
+        self._smtp = None
+
+        self._started = time.monotonic()
+        self._connections = 0
+        self._messages_sent = 0
+        self._failures = 0
+        self._send_seconds = 0.0
+        self._max_send_seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self._logger.info(f'{self._run_name} mail: {self.report()}')
+
+    def _connect(self):
+        try:
+            smtp = smtplib.SMTP(self._smtp_server, self._smtp_server_port, timeout=self._timeout)
+        except (smtplib.SMTPException, OSError) as error:
+            raise MailSessionError(f'Could not connect to {self._smtp_server}: {error}') from error
+        try:
+            smtp.login(self._smtp_server_user, self._smtp_server_password)
+        except (smtplib.SMTPException, OSError) as error:
+            smtp.close()
+            raise MailSessionError(f'Could not log in to {self._smtp_server}: {error}') from error
+        self._smtp = smtp
+        self._connections += 1
+
+    def close(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _sendmail(self, sender_address, distribution_list, message):
+        for attempt in range(2):
+            if self._smtp is None:
+                self._connect()
+            try:
+                self._smtp.sendmail(sender_address, distribution_list, message)
+                return
+            except smtplib.SMTPSenderRefused as error:
+                raise MailSessionError(f'{self._smtp_server} refused the sender address: {error}') from error
+            except Exception as error:
+                if not is_dropped_smtp_session(error):
+                    raise
+                self._smtp.close()
+                self._smtp = None
+                if attempt:
+                    raise MailSessionError(f'{self._smtp_server} dropped the session again: {error}') from error
+                self._logger.info(f'SMTP session dropped ({error}), reconnecting')
+
+    def send(self, distribution_list, email_subject, sender_address, body, file_buffer=None, output_file_name=None):
+        message = build_mail_message(distribution_list, email_subject, sender_address, body, file_buffer, output_file_name).as_string()
+        started = time.monotonic()
+        try:
+            self._sendmail(sender_address, distribution_list, message)
+        except Exception:
+            self._failures += 1
+            raise
+        send_seconds = time.monotonic() - started
+        self._messages_sent += 1
+        self._send_seconds += send_seconds
+        self._max_send_seconds = max(self._max_send_seconds, send_seconds)
+
+    def report(self):
+        return {
+            'messages_sent': self._messages_sent,
+            'failures': self._failures,
+            'connections': self._connections,
+            'elapsed_seconds': time.monotonic() - self._started,
+            'mean_send_seconds': self._send_seconds / self._messages_sent if self._messages_sent else 0.0,
+            'max_send_seconds': self._max_send_seconds,
+        }
 
 
 def tomorrow():
     return (datetime.datetime.now() + datetime.timedelta(1)).strftime('%Y-%m-%d')
 
 
+def db_now():
+    """The current time as a MySQL datetime column stores it, so a cached write compares equal
+    to the same row read back by a refresh or change log poll.
+    """
+    return datetime.datetime.now().replace(microsecond=0)
+
+
+API_PAGE_SIZE = 100
+API_MAX_PAGE_SIZE = 1000
+
+SEARCH_RESULT_LIMIT = 20
+
+IMPORT_BATCH_SIZE = 500
+# Lengths of the tasks.task_title and tasks.task_description columns.
+TASK_TITLE_MAX_LENGTH = 280
+TASK_DESCRIPTION_MAX_LENGTH = 10000
+# Weekly summary recipients whose tasks are looked up and rendered together.
+WEEKLY_SUMMARY_BATCH_SIZE = 50
+EXPORT_COLUMNS = ('task_id', 'created_at', 'updated_at', 'task_title', 'task_description', 'trigger_date', 'status')
+
+
+def iter_task_rows(stream, file_format):
+    """Parse an uploaded CSV or NDJSON task file into dicts one row at a time."""
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    if file_format == 'csv':
+        yield from csv.DictReader(text)
+    elif file_format == 'ndjson':
+        for line in text:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError(f'Unsupported task file format, {file_format}; use csv or ndjson')
+
+
+def task_row_field(row, column, max_length=None):
+    """Return an imported row's string value for column, '' if it is missing or null."""
+    value = row.get(column)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        raise ValueError(f'{column} must be a string, not {type(value).__name__}')
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f'{column} is longer than {max_length} characters')
+    return value
+
+
+def batched(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def task_url_root(url_root):
+    """Absolute URL prefix of /task/<task_id> pages, built once per table instead of per row."""
+    return f'{url_root}task/'
+
+
+TASK_TABLE_DATE_COLUMNS = {'open': 'created_at', 'scheduled': 'trigger_date', 'closed': 'updated_at'}
+TASK_TABLE_DATE_HEADERS = {'open': 'Created Date', 'scheduled': 'Trigger Date', 'closed': 'Close Date'}
+
+
+def task_table_rows(tasks, status):
+    """Return (task_id, task_title, task_description, date) tuples for a task table, in the order given."""
+    date_column = TASK_TABLE_DATE_COLUMNS[status]
+    return [
+        (task.task_id, task.task_title, task.task_description.replace('\r\n', '<br>'), getattr(task, date_column).strftime('%Y-%m-%d'))
+        for task in tasks
+    ]
+
+
+def render_task_table(task_rows, status):
+    if len(task_rows) == 0:
+        return 'None'
+    task_table = get_template_attribute('task_table.html', 'task_table')
+    return task_table(task_rows, TASK_TABLE_DATE_HEADERS[status], task_url_root(request.url_root))
+
+
 def is_safe_redirect_url(target):
     """Validate that redirect target is a safe internal URL."""
     if not target:
@@ -66,26 +266,174 @@ class User(UserMixin):
         self.email_address = email_address
         self.password_hash = password_hash
 
-    def check_password(self, password):
-        """Verify password against stored hash."""
-        if self.password_hash is None:
-            return False
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            self.password_hash.encode('utf-8')
-        )
-
     def needs_password_setup(self):
         """Check if user needs to set initial password (migration case)."""
         return self.password_hash is None
 
-    @staticmethod
-    def hash_password(password):
-        """Generate bcrypt hash for a password."""
-        return bcrypt.hashpw(
-            password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+
+# Upper bounds, in seconds, of the latency histogram buckets served on /metrics.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def format_metric(name, metric_type, help_text, samples):
+    """Lines of one metric in the Prometheus text format; samples is a value or {label tuple: value}."""
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}']
+    if not isinstance(samples, dict):
+        samples = {(): samples}
+    for labels, value in samples.items():
+        label_text = ','.join(f'{label}="{label_value}"' for label, label_value in labels)
+        lines.append(f'{name}{{{label_text}}} {value}' if label_text else f'{name} {value}')
+    return lines
+
+
+class Histogram:
+    """Latency histogram with one series per value of a single label, served on /metrics.
+
+    observe() only bumps a bucket counter under a lock, so it is cheap enough to call on every
+    request and stored-procedure call. Buckets are summed into cumulative counts at render time.
+    """
+
+    def __init__(self, name, help_text, label, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self._help_text = help_text
+        self._label = label
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        # label value -> [count per bucket, then +Inf], [observation count, sum of seconds]
+        self._series = {}
+
+    def observe(self, label_value, seconds):
+        bucket = bisect.bisect_left(self._buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = ([0] * (len(self._buckets) + 1), [0, 0.0])
+            bucket_counts, totals = series
+            bucket_counts[bucket] += 1
+            totals[0] += 1
+            totals[1] += seconds
+
+    @contextmanager
+    def time(self, label_value):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(label_value, time.perf_counter() - started)
+
+    def render(self):
+        with self._lock:
+            series = {label_value: (list(bucket_counts), list(totals)) for label_value, (bucket_counts, totals) in self._series.items()}
+        lines = [f'# HELP {self.name} {self._help_text}', f'# TYPE {self.name} histogram']
+        for label_value, (bucket_counts, (count, total_seconds)) in sorted(series.items()):
+            label_text = f'{self._label}="{label_value}"'
+            for upper_bound, cumulative_count in zip(self._buckets + ('+Inf',), itertools.accumulate(bucket_counts)):
+                lines.append(f'{self.name}_bucket{{{label_text},le="{upper_bound}"}} {cumulative_count}')
+            lines.append(f'{self.name}_count{{{label_text}}} {count}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {total_seconds}')
+        return lines
+
+
+def bcrypt_hash_password(password, rounds):
+    """Generate bcrypt hash for a password."""
+    return bcrypt.hashpw(
+        password.encode('utf-8'),
+        bcrypt.gensalt(rounds)
+    ).decode('utf-8')
+
+
+def bcrypt_check_password(password, password_hash):
+    """Verify password against stored hash."""
+    return bcrypt.checkpw(
+        password.encode('utf-8'),
+        password_hash.encode('utf-8')
+    )
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when no bcrypt slot frees up within the queue timeout."""
+
+
+class PasswordHasher:
+    """Runs bcrypt in a process pool so a burst of logins cannot starve request threads of CPU.
+
+    At most max_concurrency hashes run at once; callers beyond that wait up to queue_timeout
+    seconds for a slot, and stats() reports how long they waited. With workers=0 bcrypt runs
+    inline in the calling thread, still under the concurrency limit.
+    """
+
+    def __init__(self, rounds=12, workers=2, max_concurrency=None, queue_timeout=10):
+        self.rounds = rounds
+        self._queue_timeout = queue_timeout
+        self._max_concurrency = max_concurrency or max(workers, 1)
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._executor = None
+        if workers:
+            # Spawned rather than forked: forking a process with running threads can copy held locks.
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._rejections = 0
+        self._queue_seconds_total = 0.0
+        self._queue_seconds_max = 0.0
+        self._bcrypt_seconds_total = 0.0
+        self._bcrypt_seconds_max = 0.0
+        self.bcrypt_seconds = Histogram('taskcur_bcrypt_duration_seconds', 'Time spent in bcrypt, excluding queueing.', 'operation')
+
+    def _run(self, operation, fn, *args):
+        queued = time.monotonic()
+        if not self._slots.acquire(timeout=self._queue_timeout):
+            with self._stats_lock:
+                self._rejections += 1
+            raise PasswordHasherBusyError(f'No bcrypt slot free after {self._queue_timeout}s')
+        try:
+            started = time.monotonic()
+            if self._executor is None:
+                result = fn(*args)
+            else:
+                result = self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+        finished = time.monotonic()
+        with self._stats_lock:
+            self._calls += 1
+            self._queue_seconds_total += started - queued
+            self._queue_seconds_max = max(self._queue_seconds_max, started - queued)
+            self._bcrypt_seconds_total += finished - started
+            self._bcrypt_seconds_max = max(self._bcrypt_seconds_max, finished - started)
+        self.bcrypt_seconds.observe(operation, finished - started)
+        return result
+
+    def hash_password(self, password):
+        return self._run('hash', bcrypt_hash_password, password, self.rounds)
+
+    def check_password(self, password, password_hash):
+        if password_hash is None:
+            return False
+        return self._run('check', bcrypt_check_password, password, password_hash)
+
+    def needs_rehash(self, password_hash):
+        """Whether a hash was made with a different cost than the configured rounds."""
+        # bcrypt hashes look like $2b$<rounds>$<salt and digest>.
+        return int(password_hash.split('$')[2]) != self.rounds
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'rounds': self.rounds,
+                'max_concurrency': self._max_concurrency,
+                'calls': self._calls,
+                'rejections': self._rejections,
+                'queue_seconds_total': self._queue_seconds_total,
+                'queue_seconds_max': self._queue_seconds_max,
+                'bcrypt_seconds_total': self._bcrypt_seconds_total,
+                'bcrypt_seconds_max': self._bcrypt_seconds_max,
+            }
 
 
 def require_same_user(f):
@@ -103,25 +451,805 @@ def require_same_user(f):
     return decorated_function
 
 
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+class ConnectionPool:
+    """Fixed-size pool of MySQL connections that every stored-procedure call goes through.
+
+    Connections are opened lazily up to pool_size and kept open between calls. A connection
+    idle for longer than health_check_interval seconds is pinged (and reconnected if the
+    server dropped it) before it is handed out.
+    """
+
+    def __init__(self, logger, db_args, pool_size=5, checkout_timeout=10, health_check_interval=30):
+        self._logger = logger
+        self._db_args = db_args
+        self._pool_size = pool_size
+        self._checkout_timeout = checkout_timeout
+        self._health_check_interval = health_check_interval
+
+        # (connection, last_used) pairs, most recently returned last.
+        self._idle = []
+        self._lock = threading.Lock()
+        # Notified whenever a connection is returned or discarded, so waiters can take or open one.
+        self._available = threading.Condition(self._lock)
+        self._open_connections = 0
+
+        self._checkouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._timeouts = 0
+        self._reconnects = 0
+        self.proc_seconds = Histogram('taskcur_db_proc_duration_seconds', 'Stored procedure call time, including connection checkout.', 'proc')
+
+    def _checkout(self):
+        started = time.monotonic()
+        deadline = started + self._checkout_timeout
+        with self._available:
+            while not self._idle and self._open_connections >= self._pool_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(f'No database connection available after {self._checkout_timeout} seconds')
+                self._available.wait(remaining)
+            if self._idle:
+                conn, last_used = self._idle.pop()
+            else:
+                conn = None
+                self._open_connections += 1
+        if conn is None:
+            try:
+                conn, last_used = connect(**self._db_args), time.monotonic()
+            except Exception:
+                with self._available:
+                    self._open_connections -= 1
+                    self._available.notify()
+                raise
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._checkouts += 1
+            self._wait_seconds_total += waited
+            self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+        if time.monotonic() - last_used > self._health_check_interval and not conn.is_connected():
+            self._logger.info('Reconnecting stale pooled database connection')
+            conn.reconnect()
+            with self._lock:
+                self._reconnects += 1
+        return conn
+
+    def _discard(self, conn):
+        with self._available:
+            self._open_connections -= 1
+            self._available.notify()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self):
+        conn = self._checkout()
+        try:
+            yield conn
+        except Exception:
+            # The connection may be mid-result or dropped; don't hand it to the next caller.
+            self._discard(conn)
+            raise
+        with self._available:
+            self._idle.append((conn, time.monotonic()))
+            self._available.notify()
+
+    def callproc(self, proc, args=()):
+        """Run a stored procedure and return (column_names, rows) of its first result set."""
+        with self.proc_seconds.time(proc), self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.callproc(proc, args)
+                column_names, rows = (), []
+                for proc_result in cursor.stored_results():
+                    column_names, rows = proc_result.column_names, proc_result.fetchall()
+                    break
+            finally:
+                cursor.close()
+        return column_names, rows
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pool_size': self._pool_size,
+                'open_connections': self._open_connections,
+                'idle_connections': len(self._idle),
+                'checkouts': self._checkouts,
+                'wait_seconds_total': self._wait_seconds_total,
+                'wait_seconds_max': self._wait_seconds_max,
+                'timeouts': self._timeouts,
+                'reconnects': self._reconnects,
+            }
+
+
+class ReadWriteLock:
+    """Lets many readers or a single writer hold the lock; a waiting writer blocks new readers."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+def as_datetime(value):
+    if value is None or type(value) is datetime.datetime:
+        return value
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time())
+    raise TypeError(f'Expected a datetime, got {value!r}')
+
+
+def as_date(value):
+    if value is None or type(value) is datetime.date:
+        return value
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value) if value else None
+    raise TypeError(f'Expected a date, got {value!r}')
+
+
+def as_str(value):
+    return value if value is None or type(value) is str else str(value)
+
+
+def as_category(value):
+    """A string from a small set of values (user names, statuses): interned so records share one copy."""
+    return value if value is None else sys.intern(str(value))
+
+
+def as_int(value):
+    return value if value is None or type(value) is int else int(value)
+
+
+class Record:
+    """Slotted cache row. Subclasses list their key field first in __slots__ and map every
+    field to a type in FIELD_TYPES, which construction and update() coerce values to.
+
+    Values reach the cache from the database, from form input and from Python code, so
+    coercing on the way in keeps comparisons and sorts from meeting a str among datetimes.
+    """
+    __slots__ = ()
+    FIELD_TYPES = {}
+
+    def __init__(self, *values):
+        field_types = self.FIELD_TYPES
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, field_types[name](value))
+
+    @property
+    def key(self):
+        return getattr(self, self.__slots__[0])
+
+    def update(self, **kwargs):
+        field_types = self.FIELD_TYPES
+        for name, value in kwargs.items():
+            setattr(self, name, field_types[name](value))
+
+    def same_values(self, other):
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def to_dict(self):
+        """Return the non-key fields, matching a DataFrame row's to_dict()."""
+        return {name: getattr(self, name) for name in self.__slots__[1:]}
+
+    @classmethod
+    def from_row(cls, row, positions):
+        return cls(*[row[i] for i in positions])
+
+    @classmethod
+    def row_positions(cls, column_names):
+        """Map this record's fields to their positions in a result set's columns."""
+        column_names = list(column_names)
+        return [column_names.index(name) for name in cls.__slots__]
+
+
+class TaskRecord(Record):
+    __slots__ = (
+        'task_id',
+        'created_at',
+        'updated_at',
+        'user_name',
+        'task_title',
+        'task_description',
+        'trigger_date',
+        'status',
+        )
+    FIELD_TYPES = {
+        'task_id': as_int,
+        'created_at': as_datetime,
+        'updated_at': as_datetime,
+        'user_name': as_category,
+        'task_title': as_str,
+        'task_description': as_str,
+        'trigger_date': as_date,
+        'status': as_category,
+    }
+
+
+class UserRecord(Record):
+    __slots__ = (
+        'user_name',
+        'created_at',
+        'updated_at',
+        'email_address',
+        'summary_notification_preference',
+        'trigger_notification_preference',
+        'closed_task_display_count_preference',
+        'password_hash',
+        )
+    FIELD_TYPES = {
+        'user_name': as_category,
+        'created_at': as_datetime,
+        'updated_at': as_datetime,
+        'email_address': as_str,
+        'summary_notification_preference': as_category,
+        'trigger_notification_preference': as_category,
+        'closed_task_display_count_preference': as_int,
+        'password_hash': as_str,
+    }
+
+
+# Records measured for the bytes-per-task estimate logged after each full load.
+MEMORY_SAMPLE_SIZE = 1000
+
+
+class RecordStore:
+    """In-memory table of slotted records keyed by id, with O(1) insert, update and delete."""
+
+    def __init__(self, record_type):
+        self._record_type = record_type
+        self._records = {}
+
+    @classmethod
+    def from_rows(cls, record_type, column_names, rows):
+        store = cls(record_type)
+        positions = record_type.row_positions(column_names)
+        for row in rows:
+            store.put(record_type.from_row(row, positions))
+        return store
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, key):
+        return key in self._records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __getitem__(self, key):
+        return self._records[key]
+
+    def get(self, key, default=None):
+        return self._records.get(key, default)
+
+    def put(self, record):
+        self._records[record.key] = record
+
+    def pop(self, key, *default):
+        return self._records.pop(key, *default)
+
+    def values(self):
+        return self._records.values()
+
+    def items(self):
+        return self._records.items()
+
+    def memory_usage(self, sample_size=None):
+        """Approximate bytes held by the store: the id map, the records and their field values.
+
+        With sample_size, only that many records are measured and their size is scaled up to
+        the whole store, so the estimate costs the same at any size.
+        """
+        records = self._records.items()
+        if sample_size is not None:
+            records = itertools.islice(records, sample_size)
+        measured = 0
+        record_bytes = 0
+        seen = set()
+        for key, record in records:
+            measured += 1
+            record_bytes += sys.getsizeof(key) + sys.getsizeof(record)
+            for name in record.__slots__:
+                value = getattr(record, name)
+                # Interned strings and small ints are shared between records; count them once.
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    record_bytes += sys.getsizeof(value)
+        if measured:
+            record_bytes = record_bytes * len(self._records) / measured
+        return sys.getsizeof(self._records) + record_bytes
+
+
+# Change log ids are assigned at insert but become visible at commit, so a transaction that
+# logs many rows (add_tasks_bulk, trigger_due_tasks) can commit after newer ids were read.
+# Ids read past stay pending, and are asked for again on each poll, until they appear or
+# this many seconds pass; ids of rolled-back inserts never appear. At most
+# CHANGE_LOG_MAX_PENDING of the newest are kept.
+CHANGE_LOG_PENDING_SECONDS = 600
+CHANGE_LOG_MAX_PENDING = 100000
+# Change log rows older than the retention are deleted, at most once per purge interval.
+CHANGE_LOG_PURGE_INTERVAL = 3600
+
+
+# Rows stamped by another process's clock can land slightly behind the newest updated_at
+# already seen, so each refresh starts this far back; unchanged rows are skipped on the way in.
+DELTA_LOAD_OVERLAP = datetime.timedelta(minutes=1)
+DELTA_LOAD_BATCH_SIZE = 1000
+
+
+def get_rows_since(pool, proc, updated_at, key, batch_size=DELTA_LOAD_BATCH_SIZE):
+    """Page through a delta procedure in (updated_at, key) order, yielding (column_names, rows) per page."""
+    while True:
+        column_names, rows = pool.callproc(proc, [updated_at, key, batch_size])
+        if rows:
+            yield column_names, rows
+        if len(rows) < batch_size:
+            return
+        updated_at_position = list(column_names).index('updated_at')
+        updated_at, key = rows[-1][updated_at_position], rows[-1][0]
+
+
+def get_max_updated_at(records, default):
+    return max((record.updated_at for record in records if record.updated_at is not None), default=default)
+
+
+def get_last_change_id(pool):
+    _, proc_rows = pool.callproc('get_last_change_id')
+    return proc_rows[0][0]
+
+
+class ChangeLogPosition:
+    """How far a cache has read the change log: the newest change id read and the older ids
+    it read past before they were committed, so each poll asks only for changes not read yet.
+    """
+
+    def __init__(self, change_id=0):
+        self.change_id = change_id
+        # change_id -> time.monotonic() when it was first missed.
+        self._pending = {}
+
+    def pending_change_ids(self):
+        """Ids below change_id still to be read, dropping any pending too long to appear."""
+        now = time.monotonic()
+        self._pending = {change_id: missed_at for change_id, missed_at in self._pending.items() if now - missed_at < CHANGE_LOG_PENDING_SECONDS}
+        return sorted(self._pending)
+
+    def is_new(self, change_id):
+        return change_id > self.change_id or change_id in self._pending
+
+    def read(self, change_id):
+        """Record a change id as read, marking any ids skipped below it as pending."""
+        if change_id > self.change_id:
+            missed_at = time.monotonic()
+            for missed_change_id in range(max(self.change_id + 1, change_id - CHANGE_LOG_MAX_PENDING), change_id):
+                self._pending[missed_change_id] = missed_at
+            self.change_id = change_id
+            for expired_change_id in sorted(self._pending)[:len(self._pending) - CHANGE_LOG_MAX_PENDING]:
+                del self._pending[expired_change_id]
+        else:
+            self._pending.pop(change_id, None)
+
+    def read_new_changes(self, pool, entity, proc):
+        """Fetch the entity's changes not read yet as (change_ids, column_names, rows).
+
+        Only change ids are listed first; proc joins current rows for the new ids of this
+        entity alone, so an idle poll transfers no rows. Pass change_ids to read() once the
+        rows are applied.
+        """
+        _, id_rows = pool.callproc('get_change_ids_since', [self.change_id, json.dumps(self.pending_change_ids())])
+        new_id_rows = [(change_id, row_entity) for change_id, row_entity in id_rows if self.is_new(change_id)]
+        change_ids = [change_id for change_id, _ in new_id_rows]
+        entity_change_ids = [change_id for change_id, row_entity in new_id_rows if row_entity == entity]
+        if not entity_change_ids:
+            return change_ids, (), []
+        column_names, rows = pool.callproc(proc, [json.dumps(entity_change_ids)])
+        return change_ids, column_names, rows
+
+
+class TriggerQueue:
+    """Min-heap of (trigger_date, task_id) for scheduled tasks.
+
+    Rescheduling or removing a task leaves its old heap entry behind; entries that no longer
+    match _trigger_dates are skipped when they reach the top, and the heap is rebuilt once
+    stale entries outnumber live ones.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._trigger_dates = {}
+
+    def __len__(self):
+        return len(self._trigger_dates)
+
+    def schedule(self, task_id, trigger_date):
+        """Track a task's trigger date; None stops tracking it."""
+        if trigger_date is None:
+            self.remove(task_id)
+            return
+        if self._trigger_dates.get(task_id) == trigger_date:
+            return
+        self._trigger_dates[task_id] = trigger_date
+        heapq.heappush(self._heap, (trigger_date, task_id))
+        self._compact()
+
+    def remove(self, task_id):
+        if self._trigger_dates.pop(task_id, None) is not None:
+            self._compact()
+
+    def _is_live(self, entry):
+        trigger_date, task_id = entry
+        return self._trigger_dates.get(task_id) == trigger_date
+
+    def _compact(self):
+        if len(self._heap) > 2 * len(self._trigger_dates) + 16:
+            self._heap = [(trigger_date, task_id) for task_id, trigger_date in self._trigger_dates.items()]
+            heapq.heapify(self._heap)
+
+    def next_trigger_date(self):
+        """Earliest tracked trigger date, or None when nothing is scheduled."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def __contains__(self, task_id):
+        return task_id in self._trigger_dates
+
+    def pop_due(self, today):
+        """Stop tracking every task due on or before `today`; returns their (trigger_date, task_id), earliest first."""
+        due_entries = []
+        while self._heap and self._heap[0][0] <= today:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                del self._trigger_dates[entry[1]]
+                due_entries.append(entry)
+        return due_entries
+
+
 class Tasks:
-    def __init__(self, logger, conn):
+    """Cache of task rows, indexed by user and status.
+
+    By default every task is loaded at startup. With lazy_user_limit set, a user's tasks are
+    fetched on first access instead and only the lazy_user_limit most recently used users
+    stay cached; the cache then holds exactly the tasks of those users.
+    """
+
+    def __init__(self, logger, pool, track_changes=False, lazy_user_limit=0, track_triggers=False, task_table_cache_users=1000):
         self._logger = logger
-        self._conn = conn
+        self._pool = pool
+        self._track_changes = track_changes
+        self._track_triggers = track_triggers
+        self._change_log = ChangeLogPosition()
+        self._refreshed_through = datetime.datetime(1970, 1, 1)
+        # Guards task_info and the index. Database calls happen outside it so a slow
+        # write never blocks readers; only the cache mutation takes the write lock.
+        self._lock = ReadWriteLock()
+
+        self._lazy_user_limit = lazy_user_limit
+        # Loaded users in least- to most-recently used order; _lru_lock lets readers reorder it.
+        self._loaded_users = OrderedDict()
+        self._lru_lock = threading.Lock()
+        # Users whose tasks are being fetched, with a count of writes that raced the fetch.
+        self._loading_users = {}
+
+        # Rendered task tables per user, keyed by (status, closed_task_display_count_preference, url_root),
+        # for the task_table_cache_users most recently used users in least- to most-recent order.
+        # _user_versions is bumped on every write so a render that raced a write is not stored.
+        self._task_tables = OrderedDict()
+        self._task_table_cache_users = task_table_cache_users
+        self._user_versions = {}
+        self._task_table_lock = threading.Lock()
+        self._task_table_hits = 0
+        self._task_table_misses = 0
+
+        # Scheduled tasks of every user, cached or not, so finding due tasks never scans the cache.
+        self._trigger_queue = TriggerQueue()
 
         self._get_task_info_from_db()
 
     def _get_task_info_from_db(self):
-        self._logger.info('Getting all tasks from database')
-        proc = 'get_task_info'
-        
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc)
-        proc_result = next(cursor.stored_results())
-        table_rows = proc_result.fetchall()
+        if self._track_changes:
+            # Read the position before the load: changes landing mid-load are applied again, which is idempotent.
+            self._change_log = ChangeLogPosition(get_last_change_id(self._pool))
+
+        if self._lazy_user_limit:
+            self._logger.info(f'Loading tasks on demand for up to {self._lazy_user_limit} users')
+            # Tasks loaded later are fetched fresh, so refreshes only need rows changed from now on.
+            column_names, table_rows = TaskRecord.__slots__, []
+            self._refreshed_through = datetime.datetime.now()
+        else:
+            self._logger.info('Getting all tasks from database')
+            proc = 'get_task_info'
+
+            column_names, table_rows = self._pool.callproc(proc)
+
+        scheduled_tasks = []
+        if self._lazy_user_limit and self._track_triggers:
+            # Uncached users' tasks can still come due, so the queue is seeded from the database.
+            proc = 'get_scheduled_tasks'
+
+            _, scheduled_tasks = self._pool.callproc(proc)
+
+        with self._lock.write():
+            self.task_info = RecordStore.from_rows(TaskRecord, column_names, table_rows)
+            self._build_task_index()
+            self._refreshed_through = get_max_updated_at(self.task_info.values(), self._refreshed_through)
+            self._trigger_queue = TriggerQueue()
+            for task in self.task_info.values():
+                self._schedule_task(task)
+            for task_id, trigger_date in scheduled_tasks:
+                self._trigger_queue.schedule(task_id, trigger_date)
+        self._logger.info(f'Loaded {len(self.task_info)} tasks, {self.memory_per_task():.0f} bytes per task')
+
+    def memory_per_task(self, sample_size=MEMORY_SAMPLE_SIZE):
+        """Average bytes of cache memory per task, for sizing how many tasks a node can hold.
+
+        Estimated from sample_size tasks; pass None to measure every task.
+        """
+        with self._lock.read():
+            if len(self.task_info) == 0:
+                return 0.0
+            return self.task_info.memory_usage(sample_size) / len(self.task_info)
+
+    def _build_task_index(self):
+        """Rebuild the user_name -> status -> sorted task_ids index and closed-task order from the task cache."""
+        self._task_index = {}
+        self._closed_tasks = {}
+        for task in self.task_info.values():
+            self._task_index.setdefault(task.user_name, {}).setdefault(task.status, []).append(task.task_id)
+            if task.status == 'closed':
+                self._closed_tasks.setdefault(task.user_name, []).append(self._closed_order_key(task))
+        # Sorted once here rather than kept sorted row by row as _index_task does.
+        for user_index in self._task_index.values():
+            for task_ids in user_index.values():
+                task_ids.sort()
+        for closed_tasks in self._closed_tasks.values():
+            closed_tasks.sort()
 
-        self.task_info = pd.DataFrame(table_rows, columns=proc_result.column_names).set_index('task_id')
-        self._conn.close()
+    @staticmethod
+    def _closed_order_key(task):
+        return (task.updated_at or datetime.datetime.min, task.task_id)
+
+    def _index_task(self, task):
+        # Task ids are kept sorted so a page of them starts at a bisect; new tasks append at the end.
+        bisect.insort(self._task_index.setdefault(task.user_name, {}).setdefault(task.status, []), task.task_id)
+        if task.status == 'closed':
+            # Kept sorted by close time so the most recent N are a slice, not a sort of the whole history.
+            bisect.insort(self._closed_tasks.setdefault(task.user_name, []), self._closed_order_key(task))
+
+    def _unindex_task(self, task):
+        user_index = self._task_index.get(task.user_name, {})
+        task_ids = user_index.get(task.status)
+        if task_ids is None:
+            return
+        position = bisect.bisect_left(task_ids, task.task_id)
+        if position < len(task_ids) and task_ids[position] == task.task_id:
+            del task_ids[position]
+        if not task_ids:
+            del user_index[task.status]
+        if not user_index:
+            self._task_index.pop(task.user_name, None)
+        if task.status == 'closed':
+            closed_tasks = self._closed_tasks.get(task.user_name, [])
+            key = self._closed_order_key(task)
+            position = bisect.bisect_left(closed_tasks, key)
+            if position < len(closed_tasks) and closed_tasks[position] == key:
+                del closed_tasks[position]
+            if not closed_tasks:
+                self._closed_tasks.pop(task.user_name, None)
+
+    def _reindex_task(self, task):
+        """Move a cached task to its new (user_name, status) slot in the index."""
+        previous = self.task_info.get(task.task_id)
+        if previous is not None:
+            self._unindex_task(previous)
+        self._index_task(task)
+
+    def _note_write(self, user_name=None):
+        """Record a write that may have raced an in-flight load_user fetch (None: user unknown)."""
+        for loading_user_name in self._loading_users:
+            if user_name is None or loading_user_name == user_name:
+                self._loading_users[loading_user_name] += 1
+        if user_name is not None:
+            self.invalidate_task_tables(user_name)
+
+    def invalidate_task_tables(self, user_name):
+        """Drop a user's rendered task tables after their tasks or display preferences change."""
+        with self._task_table_lock:
+            self._user_versions[user_name] = self._user_versions.get(user_name, 0) + 1
+            self._task_tables.pop(user_name, None)
+
+    def get_user_version(self, user_name):
+        """Counter bumped by every write to a user's tasks or display preferences, for ETags."""
+        with self._task_table_lock:
+            return self._user_versions.get(user_name, 0)
+
+    def task_table_cache_stats(self):
+        with self._task_table_lock:
+            return {
+                'hits': self._task_table_hits,
+                'misses': self._task_table_misses,
+                'users': len(self._task_tables),
+                'max_users': self._task_table_cache_users,
+                'tables': sum(len(task_tables) for task_tables in self._task_tables.values()),
+            }
+
+    def _is_cached_user(self, user_name):
+        return not self._lazy_user_limit or user_name in self._loaded_users
+
+    def _schedule_task(self, task):
+        self._trigger_queue.schedule(task.task_id, task.trigger_date if task.status == 'scheduled' else None)
+
+    def _put_task(self, task):
+        """Insert or replace a task in the cache and index. Call with the write lock held.
+
+        A row identical to the cached one, e.g. from the refresh overlap, changes nothing and
+        keeps the user's rendered tables and ETag version.
+        """
+        cached_task = self.task_info.get(task.task_id)
+        if cached_task is not None and cached_task.same_values(task):
+            return
+        self._note_write(task.user_name)
+        self._schedule_task(task)
+        if self._is_cached_user(task.user_name):
+            self._reindex_task(task)
+            self.task_info.put(task)
+
+    def _drop_task(self, task_id):
+        task = self.task_info.pop(task_id, None)
+        if task is not None:
+            self._unindex_task(task)
+        return task
+
+    def _forget_task(self, task_id):
+        """Remove a deleted task from the cache. Call with the write lock held. Returns whether it was cached."""
+        task = self._drop_task(task_id)
+        self._trigger_queue.remove(task_id)
+        self._note_write(None if task is None else task.user_name)
+        return task is not None
+
+    def load_user(self, user_name):
+        """Make sure a user's tasks are cached, fetching them on first access in lazy mode."""
+        if not self._lazy_user_limit:
+            return
+        with self._lru_lock:
+            if user_name in self._loaded_users:
+                self._loaded_users.move_to_end(user_name)
+                return
+
+        proc = 'get_task_info_for_user'
+
+        while True:
+            with self._lock.write():
+                if user_name in self._loaded_users:
+                    return
+                writes_seen = self._loading_users.setdefault(user_name, 0)
+
+            column_names, table_rows = self._pool.callproc(proc, [user_name])
+
+            positions = TaskRecord.row_positions(column_names)
+            with self._lock.write():
+                if user_name in self._loaded_users:
+                    return
+                if self._loading_users[user_name] != writes_seen:
+                    # A write for this user landed while fetching; the rows may predate it.
+                    continue
+                del self._loading_users[user_name]
+                with self._lru_lock:
+                    self._loaded_users[user_name] = None
+                    evicted_user_names = []
+                    while len(self._loaded_users) > self._lazy_user_limit:
+                        evicted_user_names.append(self._loaded_users.popitem(last=False)[0])
+                for evicted_user_name in evicted_user_names:
+                    for task_id in self._get_task_ids_for_user(evicted_user_name):
+                        self._drop_task(task_id)
+                    self.invalidate_task_tables(evicted_user_name)
+                for row in table_rows:
+                    task = TaskRecord.from_row(row, positions)
+                    self._reindex_task(task)
+                    self.task_info.put(task)
+                return
+
+    def _get_task_owner(self, task_id):
+        proc = 'get_task_owner'
+
+        _, proc_rows = self._pool.callproc(proc, [task_id])
+        if not proc_rows:
+            raise KeyError(task_id)
+        return proc_rows[0][0]
+
+    def poll_changes(self):
+        """Apply task writes logged by any process since the last poll. Returns the number of changes applied."""
+        proc = 'get_task_changes'
+
+        change_ids, column_names, table_rows = self._change_log.read_new_changes(self._pool, 'task', proc)
+
+        changes_applied = 0
+        with self._lock.write():
+            if table_rows:
+                column_names = list(column_names)
+                positions = TaskRecord.row_positions(column_names)
+                user_name_position = column_names.index('user_name')
+                for row in table_rows:
+                    task_id = row[positions[0]]
+                    # The change log is joined to the current row, so a missing row means the task is gone.
+                    if row[user_name_position] is None:
+                        self._forget_task(task_id)
+                    else:
+                        self._put_task(TaskRecord.from_row(row, positions))
+                    changes_applied += 1
+            for change_id in change_ids:
+                self._change_log.read(change_id)
+        return changes_applied
+
+    def refresh(self):
+        """Upsert tasks changed since the last load or refresh. Returns the number of rows fetched.
+
+        Only rows with a newer updated_at are transferred; deletions are not visible here and
+        reach the cache through poll_changes.
+        """
+        proc = 'get_task_info_since'
+
+        rows_fetched = 0
+        for column_names, table_rows in get_rows_since(self._pool, proc, self._refreshed_through - DELTA_LOAD_OVERLAP, 0):
+            positions = TaskRecord.row_positions(column_names)
+            tasks = [TaskRecord.from_row(row, positions) for row in table_rows]
+            with self._lock.write():
+                for task in tasks:
+                    self._put_task(task)
+                self._refreshed_through = get_max_updated_at(tasks, self._refreshed_through)
+            rows_fetched += len(tasks)
+        return rows_fetched
+
+    def forget_user(self, user_name):
+        """Drop a deleted user's tasks, which the database removes by cascade without logging them."""
+        with self._lock.write():
+            for task_id in self._get_task_ids_for_user(user_name):
+                self._forget_task(task_id)
+            with self._lru_lock:
+                self._loaded_users.pop(user_name, None)
 
     def add_task(self, user_name, **kwargs):
         task_title = kwargs['task_title']
@@ -138,16 +1266,12 @@ class Tasks:
 
         proc = 'add_task'
             
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [user_name, task_title, task_description, trigger_date, status])
-        proc_result = next(cursor.stored_results())
-        task_id, created_at, updated_at = proc_result.fetchone()
-        self._conn.close()
-
-        self.task_info = pd.concat([
-            self.task_info,
-            pd.DataFrame([[
+        _, proc_rows = self._pool.callproc(proc, [user_name, task_title, task_description, trigger_date, status])
+        task_id, created_at, updated_at = proc_rows[0]
+
+        with self._lock.write():
+            self._put_task(TaskRecord(
+                task_id,
                 created_at, 
                 updated_at, 
                 user_name, 
@@ -155,81 +1279,269 @@ class Tasks:
                 task_description, 
                 trigger_date, 
                 status
-                ]], columns=self.task_info.columns, index=[task_id]).astype(self.task_info.dtypes)
-        ])
-        
+                ))
+
+    def add_tasks(self, user_name, rows):
+        """Insert a batch of tasks with one multi-row statement and merge them into the cache
+        under one write lock. Rows carry task_title, task_description and trigger_date like the
+        create-task form, plus an optional status of closed. Returns the number inserted, or
+        raises ValueError before inserting any if a row is not an object of strings that fit
+        the task columns.
+        """
+        tasks = []
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ValueError(f'Every task must be an object, not {type(row).__name__}')
+            task_title = task_row_field(row, 'task_title', TASK_TITLE_MAX_LENGTH)
+            if not task_title.strip():
+                raise ValueError('Every task needs a task_title')
+            task_description = task_row_field(row, 'task_description', TASK_DESCRIPTION_MAX_LENGTH)
+            trigger_date = task_row_field(row, 'trigger_date') or None
+            if task_row_field(row, 'status') == 'closed':
+                status, trigger_date = 'closed', None
+            elif trigger_date is None:
+                status = 'open'
+            else:
+                status = 'scheduled'
+                datetime.datetime.strptime(trigger_date, '%Y-%m-%d')
+            tasks.append({'task_title': task_title, 'task_description': task_description, 'trigger_date': trigger_date, 'status': status})
+
+        proc = 'add_tasks_bulk'
+
+        column_names, table_rows = self._pool.callproc(proc, [user_name, json.dumps(tasks)])
+
+        positions = TaskRecord.row_positions(column_names)
+        with self._lock.write():
+            for row in table_rows:
+                self._put_task(TaskRecord.from_row(row, positions))
+        return len(tasks)
+
+    def _read_user_tasks(self, user_name, read):
+        """Return read(), called under the read lock with user_name's tasks cached.
+
+        In lazy mode another thread's load_user can evict the user between loading and
+        reading, so the load is repeated until the read finds the user still cached.
+        """
+        while True:
+            self.load_user(user_name)
+            with self._lock.read():
+                if self._is_cached_user(user_name):
+                    return read()
 
     def get_task_info(self, task_id):
-        return self.task_info.loc[int(task_id)].to_dict()
+        task_id = int(task_id)
+        user_name = None
+        if self._lazy_user_limit:
+            with self._lock.read():
+                task = self.task_info.get(task_id)
+            user_name = self._get_task_owner(task_id) if task is None else task.user_name
+        return self._read_user_tasks(user_name, lambda: self.task_info[task_id].to_dict())
     
-    def get_tasks_for_user(self, user_name, status=None):
+    def _get_task_ids_for_user(self, user_name, status=None):
+        user_index = self._task_index.get(user_name, {})
         if status is None:
-            return self.task_info.loc[self.task_info['user_name'] == user_name]
+            return [task_id for task_ids in user_index.values() for task_id in task_ids]
         else:
-            return self.task_info.loc[(self.task_info['user_name'] == user_name) & (self.task_info['status'] == status)]
+            return list(user_index.get(status, ()))
+
+    def get_task_ids_for_user(self, user_name, status=None):
+        return self._read_user_tasks(user_name, lambda: self._get_task_ids_for_user(user_name, status))
+
+    def get_tasks_for_user(self, user_name, status=None):
+        # Records are replaced rather than mutated on write, so the returned list is a stable snapshot.
+        return self._read_user_tasks(
+            user_name,
+            lambda: [self.task_info[task_id] for task_id in self._get_task_ids_for_user(user_name, status)],
+            )
+
+    def get_tasks_for_users(self, user_names):
+        """Return {user_name: [TaskRecord]} for a batch of users, e.g. weekly summary recipients.
+
+        Users not in the cache are fetched together in one query and are not added to it, so
+        a job over every user neither evicts the active users in lazy mode nor makes a round
+        trip per user.
+        """
+        tasks_by_user = {}
+        uncached_user_names = []
+        with self._lock.read():
+            for user_name in user_names:
+                if self._is_cached_user(user_name):
+                    tasks_by_user[user_name] = [self.task_info[task_id] for task_id in self._get_task_ids_for_user(user_name)]
+                else:
+                    uncached_user_names.append(user_name)
+                    tasks_by_user[user_name] = []
+        if not uncached_user_names:
+            return tasks_by_user
+
+        proc = 'get_task_info_for_users'
+
+        column_names, table_rows = self._pool.callproc(proc, [json.dumps(uncached_user_names)])
+
+        positions = TaskRecord.row_positions(column_names)
+        for row in table_rows:
+            task = TaskRecord.from_row(row, positions)
+            tasks_by_user[task.user_name].append(task)
+        return tasks_by_user
+
+    def get_task_page(self, user_name, status=None, after=0, limit=100):
+        """Return up to `limit` of a user's tasks with task_id > after, in task_id order, and
+        whether more follow. Paging by key rather than offset makes each page a bisect into the
+        sorted index plus `limit` rows, and keeps pages stable while tasks are added or closed
+        between requests.
+        """
+        def read_page():
+            user_index = self._task_index.get(user_name, {})
+            runs = []
+            for task_ids in (user_index.values() if status is None else [user_index.get(status, [])]):
+                position = bisect.bisect_right(task_ids, after)
+                runs.append(task_ids[position:position + limit + 1])
+            page_task_ids = list(itertools.islice(heapq.merge(*runs), limit + 1))
+            return [self.task_info[task_id] for task_id in page_task_ids[:limit]], len(page_task_ids) > limit
+
+        return self._read_user_tasks(user_name, read_page)
+
+    def search_tasks(self, user_name, query, status=None, limit=SEARCH_RESULT_LIMIT):
+        """Return a user's `limit` best matches for `query` in task titles and descriptions,
+        as (TaskRecord, score) pairs, best first. Backed by the tasks full-text index, so the
+        cost follows the matches rather than the bytes of description searched.
+        """
+        proc = 'search_tasks'
+
+        column_names, table_rows = self._pool.callproc(proc, [user_name, query, status, limit])
+
+        positions = TaskRecord.row_positions(column_names)
+        score_position = list(column_names).index('score')
+        return [(TaskRecord.from_row(row, positions), float(row[score_position])) for row in table_rows]
+
+    def get_task_counts_by_user(self):
+        """Count every user's tasks by status in one pass, as {user_name: {status: count}}."""
+        if self._lazy_user_limit:
+            # Most users are not cached, so let the database group them in one query.
+            proc = 'get_task_counts_by_user'
+
+            _, proc_rows = self._pool.callproc(proc)
+
+            task_counts = {}
+            for user_name, status, task_count in proc_rows:
+                task_counts.setdefault(user_name, {})[status] = task_count
+            return task_counts
+
+        with self._lock.read():
+            return {
+                user_name: {status: len(task_ids) for status, task_ids in user_index.items()}
+                for user_name, user_index in self._task_index.items()
+            }
+
+    def get_recently_closed_tasks(self, user_name, count):
+        """Return a user's `count` most recently closed tasks, newest first, without sorting their history."""
+        if count <= 0:
+            return []
+        return self._read_user_tasks(
+            user_name,
+            lambda: [self.task_info[task_id] for _, task_id in reversed(self._closed_tasks.get(user_name, [])[-count:])],
+            )
+
+    def has_due_tasks(self, today):
+        """Whether any scheduled task is due on or before `today`, from the trigger queue alone."""
+        with self._lock.write():
+            next_trigger_date = self._trigger_queue.next_trigger_date()
+        return next_trigger_date is not None and next_trigger_date <= today
+
+    def trigger_due_tasks(self, today):
+        """Open every scheduled task due on or before `today` in one statement. Returns the triggered tasks."""
+        self._logger.info(f'Triggering tasks due by {today}')
+
+        updated_at = db_now()
+
+        # Claimed before the call, so a task scheduled while the procedure runs stays queued;
+        # claimed entries the procedure does not return were deleted or rescheduled elsewhere.
+        with self._lock.write():
+            due_entries = self._trigger_queue.pop_due(today)
+
+        proc = 'trigger_due_tasks'
+
+        try:
+            column_names, table_rows = self._pool.callproc(proc, [today, updated_at])
+        except Exception:
+            with self._lock.write():
+                for trigger_date, task_id in due_entries:
+                    if task_id not in self._trigger_queue:
+                        self._trigger_queue.schedule(task_id, trigger_date)
+            raise
+
+        positions = TaskRecord.row_positions(column_names)
+        triggered_tasks = [TaskRecord.from_row(row, positions) for row in table_rows]
+        with self._lock.write():
+            for task in triggered_tasks:
+                self._put_task(task)
+        return triggered_tasks
         
     def get_task_table_for_user_and_status(self, user_name, closed_task_display_count_preference, status):
-        tasks_df = self.get_tasks_for_user(user_name, status)
-        if len(tasks_df) == 0:
-            task_html = 'None'
-        else:
-            tasks_df.loc[:, 'task_description'] = tasks_df.apply(lambda r_: r_['task_description'].replace('\r\n', '<br>'), axis=1)
-            date_header = {'open': 'Created Date', 'scheduled': 'Trigger Date', 'closed': 'Close Date'}[status]
-            date_column = {'open': 'created_at', 'scheduled': 'trigger_date', 'closed': 'updated_at'}[status]
-            task_html = f'''
-                <table cellpadding=1 cellspacing=0>
-                    <col width="100">
-                    <col width="190">
-                    <col width="90">
-                    <tr bgcolor="#002060", style="color:white;" align="center">
-                        <th>Title</th>
-                        <th>Description</th>
-                        <th>{date_header}</th>
-                    </tr>
-                '''
-            if status == 'closed':
-                df = tasks_df.sort_values(date_column, ascending=False).head(int(closed_task_display_count_preference))
-            else:
-                df = tasks_df.sort_values(date_column, ascending=True)
-            for task_id, r_ in df.iterrows():
-                if isinstance(r_[date_column], str):
-                    date_col_val = r_[date_column]
-                else:
-                    date_col_val = r_[date_column].strftime('%Y-%m-%d')
-                task_html += f'''
-                    <tr>
-                        <td><a href="{url_for('/task/<task_id>', task_id=task_id, _external=True)}">{r_['task_title']}</a></td>
-                        <td>{r_['task_description']}</td>
-                        <td align="center">{date_col_val}</td>
-                    </tr>
-                    '''
-            task_html += '</table>'
+        # Links in the table are absolute, so the same table differs per host it is served from.
+        key = (status, int(closed_task_display_count_preference), request.url_root)
+        with self._task_table_lock:
+            version = self._user_versions.get(user_name, 0)
+            task_html = self._task_tables.get(user_name, {}).get(key)
+            if task_html is not None:
+                self._task_table_hits += 1
+                self._task_tables.move_to_end(user_name)
+                return task_html
+            self._task_table_misses += 1
+
+        task_html = self._render_task_table(user_name, closed_task_display_count_preference, status)
+
+        with self._task_table_lock:
+            if self._user_versions.get(user_name, 0) == version and self._task_table_cache_users > 0:
+                self._task_tables.setdefault(user_name, {})[key] = task_html
+                self._task_tables.move_to_end(user_name)
+                while len(self._task_tables) > self._task_table_cache_users:
+                    self._task_tables.popitem(last=False)
         return task_html
+
+    def get_task_rows_for_user_and_status(self, user_name, closed_task_display_count_preference, status):
+        """Return (task_id, task_title, task_description, date) tuples for a task table, in display order."""
+        if status == 'closed':
+            tasks = self.get_recently_closed_tasks(user_name, int(closed_task_display_count_preference))
+        else:
+            date_column = TASK_TABLE_DATE_COLUMNS[status]
+            tasks = sorted(self.get_tasks_for_user(user_name, status), key=lambda t_: (getattr(t_, date_column), t_.task_id))
+        return task_table_rows(tasks, status)
+
+    @classmethod
+    def order_for_task_table(cls, tasks, closed_task_display_count_preference, status):
+        """Pick one status's tasks out of a user's task list, ordered as their task table shows them."""
+        tasks = [task for task in tasks if task.status == status]
+        if status == 'closed':
+            return heapq.nlargest(int(closed_task_display_count_preference), tasks, key=cls._closed_order_key)
+        date_column = TASK_TABLE_DATE_COLUMNS[status]
+        return sorted(tasks, key=lambda t_: (getattr(t_, date_column), t_.task_id))
+
+    def _render_task_table(self, user_name, closed_task_display_count_preference, status):
+        task_rows = self.get_task_rows_for_user_and_status(user_name, closed_task_display_count_preference, status)
+        return render_task_table(task_rows, status)
     
     def close_task(self, task_id):
 
         self._logger.info(f'Closing task, {task_id}')
 
-        status, updated_at = 'closed', datetime.datetime.now()
+        status, updated_at = 'closed', db_now()
 
         proc = 'close_task'
 
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [status, updated_at, task_id])
-        proc_result = next(cursor.stored_results())
-        created_at, user_name, task_title, task_description, trigger_date = proc_result.fetchone()
-        self._conn.close()
-
-        self.task_info.loc[int(task_id), ['created_at', 'updated_at', 'user_name', 'task_title', 'task_description', 'trigger_date', 'status']] = [
-            created_at, 
-            str(updated_at), 
-            user_name, 
-            task_title, 
-            task_description, 
-            trigger_date, 
-            status
-            ]
+        _, proc_rows = self._pool.callproc(proc, [status, updated_at, task_id])
+        created_at, user_name, task_title, task_description, trigger_date = proc_rows[0]
+
+        with self._lock.write():
+            self._put_task(TaskRecord(
+                int(task_id),
+                created_at, 
+                updated_at, 
+                user_name, 
+                task_title, 
+                task_description, 
+                trigger_date, 
+                status
+                ))
     
     def delete_task(self, task_id):
 
@@ -237,12 +1549,10 @@ class Tasks:
 
         proc = 'delete_task'
 
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [task_id])
-        self._conn.close()
+        self._pool.callproc(proc, [task_id])
 
-        self.task_info.drop(int(task_id), inplace=True)
+        with self._lock.write():
+            self._forget_task(int(task_id))
     
     def update_task(self, task_id, **kwargs):
         task_title = kwargs['task_title']
@@ -254,34 +1564,40 @@ class Tasks:
             trigger_date = None
         else:
             status = 'scheduled'
-            trigger_date = pd.to_datetime(trigger_date).date()
+            trigger_date = datetime.datetime.strptime(trigger_date, '%Y-%m-%d').date()
 
-        updated_at = datetime.datetime.now()
+        updated_at = db_now()
 
         proc = 'update_task'
 
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [task_title, task_description, trigger_date, status, updated_at, task_id])
-        proc_result = next(cursor.stored_results())
-        created_at, user_name  = proc_result.fetchone()
-        self._conn.close()
-
-        self.task_info.loc[int(task_id), ['created_at', 'updated_at', 'user_name', 'task_title', 'task_description', 'trigger_date', 'status']] = [
-            created_at, 
-            updated_at, 
-            user_name, 
-            task_title, 
-            task_description, 
-            trigger_date, 
-            status
-            ]
+        _, proc_rows = self._pool.callproc(proc, [task_title, task_description, trigger_date, status, updated_at, task_id])
+        created_at, user_name  = proc_rows[0]
+
+        with self._lock.write():
+            self._put_task(TaskRecord(
+                int(task_id),
+                created_at, 
+                updated_at, 
+                user_name, 
+                task_title, 
+                task_description, 
+                trigger_date, 
+                status
+                ))
 
 
 class Users:
-    def __init__(self, logger, conn):
+    def __init__(self, logger, pool, track_changes=False):
         self._logger = logger
-        self._conn = conn
+        self._pool = pool
+        self._track_changes = track_changes
+        self._change_log = ChangeLogPosition()
+        self._refreshed_through = datetime.datetime(1970, 1, 1)
+        # Guards user_info; see Tasks._lock.
+        self._lock = ReadWriteLock()
+        # Prebuilt Flask-Login users, filled on first lookup. Entries are only added under the
+        # read lock and dropped under the write lock, so a lookup never caches a stale user.
+        self._login_users = {}
 
         self._get_user_info_from_db()
 
@@ -289,14 +1605,29 @@ class Users:
         self._logger.info('Getting all users from database')
         proc = 'get_user_info'
 
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc)
-        proc_result = next(cursor.stored_results())
-        table_rows = proc_result.fetchall()
+        if self._track_changes:
+            self._change_log = ChangeLogPosition(get_last_change_id(self._pool))
+
+        column_names, table_rows = self._pool.callproc(proc)
+
+        user_info = RecordStore.from_rows(UserRecord, column_names, table_rows)
+        with self._lock.write():
+            self.user_info = user_info
+            self._login_users = {}
+            self._refreshed_through = get_max_updated_at(user_info.values(), self._refreshed_through)
 
-        self.user_info = pd.DataFrame(table_rows, columns=proc_result.column_names).set_index('user_name')
-        self._conn.close()
+    def _put_user(self, user):
+        """Insert or replace a user record. Call with the write lock held. An identical row keeps the cached login User."""
+        cached_user = self.user_info.get(user.user_name)
+        if cached_user is not None and cached_user.same_values(user):
+            return
+        self.user_info.put(user)
+        self._login_users.pop(user.user_name, None)
+
+    def _pop_user(self, user_name):
+        """Remove a user record, returning it or None. Call with the write lock held."""
+        self._login_users.pop(user_name, None)
+        return self.user_info.pop(user_name, None)
 
     def add_user(self, **kwargs):
         user_name = kwargs['user_name']
@@ -308,46 +1639,97 @@ class Users:
         self._logger.info(f'Adding user, {user_name}, to database')
         proc = 'add_user'
 
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [user_name, email_address, summary_notification_preference, trigger_notification_preference, closed_task_display_count_preference, password_hash])
-        proc_result = next(cursor.stored_results())
-        created_at, updated_at = proc_result.fetchone()
-        self._conn.close()
+        _, proc_rows = self._pool.callproc(proc, [user_name, email_address, summary_notification_preference, trigger_notification_preference, closed_task_display_count_preference, password_hash])
+        created_at, updated_at = proc_rows[0]
 
-        self.user_info.loc[user_name] = [created_at, updated_at, email_address, summary_notification_preference, trigger_notification_preference, closed_task_display_count_preference, password_hash]
+        with self._lock.write():
+            self._put_user(UserRecord(user_name, created_at, updated_at, email_address, summary_notification_preference, trigger_notification_preference, closed_task_display_count_preference, password_hash))
 
     def get_user_for_login(self, user_name):
-        """Return a User object suitable for Flask-Login, or None if not found."""
-        if user_name not in self.user_info.index:
-            return None
-        user_data = self.user_info.loc[user_name]
-        password_hash = user_data.get('password_hash')
-        if pd.isna(password_hash):
-            password_hash = None
-        return User(
-            user_name=user_name,
-            email_address=user_data['email_address'],
-            password_hash=password_hash
-        )
+        """Return a User object suitable for Flask-Login, or None if not found.
+
+        Runs on every authenticated request, so the User is built once and shared until the
+        user changes; callers must not modify it.
+        """
+        user = self._login_users.get(user_name)
+        if user is not None:
+            return user
+        with self._lock.read():
+            user_record = self.user_info.get(user_name)
+            if user_record is None:
+                return None
+            user = self._login_users[user_name] = User(
+                user_name=user_name,
+                email_address=user_record.email_address,
+                password_hash=user_record.password_hash
+            )
+            return user
 
     def set_user_password(self, user_name, password_hash):
         """Set password hash for a user (used for initial password setup)."""
         self._logger.info(f'Setting password for user: {user_name}')
-        updated_at = datetime.datetime.now()
+        updated_at = db_now()
 
         proc = 'set_password'
 
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [user_name, password_hash, updated_at])
-        self._conn.close()
+        self._pool.callproc(proc, [user_name, password_hash, updated_at])
 
-        self.user_info.loc[user_name, 'password_hash'] = password_hash
-        self.user_info.loc[user_name, 'updated_at'] = updated_at
+        with self._lock.write():
+            self.user_info[user_name].update(password_hash=password_hash, updated_at=updated_at)
+            self._login_users.pop(user_name, None)
 
     def get_user_info(self, user_name):
-        return self.user_info.loc[user_name].to_dict()
+        with self._lock.read():
+            return self.user_info[user_name].to_dict()
+
+    def poll_changes(self):
+        """Apply user writes logged by any process since the last poll.
+
+        Returns the number of changes applied and the names of deleted users.
+        """
+        proc = 'get_user_changes'
+
+        change_ids, column_names, table_rows = self._change_log.read_new_changes(self._pool, 'user', proc)
+
+        changes_applied = 0
+        deleted_user_names = []
+        with self._lock.write():
+            if table_rows:
+                column_names = list(column_names)
+                positions = UserRecord.row_positions(column_names)
+                email_address_position = column_names.index('email_address')
+                for row in table_rows:
+                    user_name = row[positions[0]]
+                    if row[email_address_position] is None:
+                        # Reported even when this process deleted the record itself, so its tasks are dropped too.
+                        self._pop_user(user_name)
+                        deleted_user_names.append(user_name)
+                    else:
+                        self._put_user(UserRecord.from_row(row, positions))
+                    changes_applied += 1
+            for change_id in change_ids:
+                self._change_log.read(change_id)
+        return changes_applied, deleted_user_names
+
+    def refresh(self):
+        """Upsert users changed since the last load or refresh. Returns the number of rows fetched."""
+        proc = 'get_user_info_since'
+
+        rows_fetched = 0
+        for column_names, table_rows in get_rows_since(self._pool, proc, self._refreshed_through - DELTA_LOAD_OVERLAP, ''):
+            positions = UserRecord.row_positions(column_names)
+            users = [UserRecord.from_row(row, positions) for row in table_rows]
+            with self._lock.write():
+                for user in users:
+                    self._put_user(user)
+                self._refreshed_through = get_max_updated_at(users, self._refreshed_through)
+            rows_fetched += len(users)
+        return rows_fetched
+
+    def get_users(self):
+        """Return a snapshot of (user_name, user_info) pairs that is safe to iterate during writes."""
+        with self._lock.read():
+            return [(user_name, user_record.to_dict()) for user_name, user_record in self.user_info.items()]
     
     def delete_user(self, user_name):
 
@@ -355,12 +1737,10 @@ class Users:
 
         proc = 'delete_user'
         
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [user_name])
-        self._conn.close()
+        self._pool.callproc(proc, [user_name])
 
-        self.user_info.drop(user_name, inplace=True)
+        with self._lock.write():
+            self._pop_user(user_name)
     
     def update_user(self, user_name, **kwargs):
         email_address = kwargs['email_address']
@@ -369,39 +1749,438 @@ class Users:
         closed_task_display_count_preference = kwargs['closed_task_display_count_preference']
         self._logger.info(f'updating user, {user_name}')
 
-        updated_at = datetime.datetime.now()
+        updated_at = db_now()
 
         proc = 'update_user'
         
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc, [updated_at, email_address, summary_notification_preference, trigger_notification_preference, closed_task_display_count_preference, user_name])
-        proc_result = next(cursor.stored_results())
-        created_at = proc_result.fetchone()
-        self._conn.close()
-
-
-        self.user_info.loc[user_name, ['created_at', 'updated_at', 'email_address', 'summary_notification_preference', 'trigger_notification_preference', 'closed_task_display_count_preference']] = [
-            created_at[0], 
-            updated_at, 
-            email_address, 
-            summary_notification_preference, 
-            trigger_notification_preference,
-            closed_task_display_count_preference
-            ]
+        _, proc_rows = self._pool.callproc(proc, [updated_at, email_address, summary_notification_preference, trigger_notification_preference, closed_task_display_count_preference, user_name])
+        created_at = proc_rows[0]
+
+
+        with self._lock.write():
+            self.user_info[user_name].update(
+                created_at=created_at[0], 
+                updated_at=updated_at, 
+                email_address=email_address, 
+                summary_notification_preference=summary_notification_preference, 
+                trigger_notification_preference=trigger_notification_preference,
+                closed_task_display_count_preference=closed_task_display_count_preference
+                )
+            self._login_users.pop(user_name, None)
     
     def _purge_inactive_users(self):
         self._logger.info(f'purging inactive users')
 
         proc = 'purge_inactive_users'
         
-        self._conn.reconnect()
-        cursor = self._conn.cursor()
-        cursor.callproc(proc)
-        self._conn.close()
+        _, proc_rows = self._pool.callproc(proc)
 
-        self._get_user_info_from_db()
-     
+        with self._lock.write():
+            for user_name, in proc_rows:
+                self._pop_user(user_name)
+
+
+class ChangeLogPoller:
+    """Background thread that applies writes made by other app processes to this process's caches.
+
+    Staleness is bounded by the poll interval; stats() reports how long ago the last
+    successful poll finished so it can be monitored. With retention_hours set it also
+    deletes older change log rows, at most once per CHANGE_LOG_PURGE_INTERVAL.
+    """
+
+    def __init__(self, logger, pool, tasks, users, interval, retention_hours=0):
+        self._logger = logger
+        self._pool = pool
+        self._tasks = tasks
+        self._users = users
+        self._interval = interval
+        self._retention = datetime.timedelta(hours=retention_hours)
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._polls = 0
+        self._errors = 0
+        self._changes_applied = 0
+        self._changes_purged = 0
+        self._last_success = time.monotonic()
+        self._last_purge = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='change-log-poller', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def poll(self):
+        user_changes_applied, deleted_user_names = self._users.poll_changes()
+        for user_name in deleted_user_names:
+            self._tasks.forget_user(user_name)
+        return user_changes_applied + self._tasks.poll_changes()
+
+    def purge(self):
+        """Delete change log rows older than the retention. Returns the number deleted."""
+        proc = 'purge_change_log'
+
+        _, proc_rows = self._pool.callproc(proc, [datetime.datetime.now() - self._retention])
+        self._last_purge = time.monotonic()
+        return proc_rows[0][0]
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            try:
+                changes_applied = self.poll()
+            except Exception:
+                self._errors += 1
+                self._logger.exception('Change log poll failed')
+                continue
+            self._polls += 1
+            self._changes_applied += changes_applied
+            self._last_success = time.monotonic()
+            if self._retention and (self._last_purge is None or time.monotonic() - self._last_purge > CHANGE_LOG_PURGE_INTERVAL):
+                try:
+                    self._changes_purged += self.purge()
+                except Exception:
+                    self._errors += 1
+                    self._logger.exception('Change log purge failed')
+
+    def stats(self):
+        return {
+            'interval_seconds': self._interval,
+            'staleness_seconds': time.monotonic() - self._last_success,
+            'polls': self._polls,
+            'errors': self._errors,
+            'changes_applied': self._changes_applied,
+            'changes_purged': self._changes_purged,
+        }
+
+
+class TriggerScheduler:
+    """Background thread that triggers due tasks in-process instead of waiting for /daily-task-trigger.
+
+    It wakes at each resolution boundary (midnight, the top of the hour or of the minute)
+    and only calls `trigger` when the task cache's trigger queue has something due.
+    """
+
+    RESOLUTIONS = {
+        'daily': datetime.timedelta(days=1),
+        'hourly': datetime.timedelta(hours=1),
+        'minute': datetime.timedelta(minutes=1),
+    }
+
+    def __init__(self, logger, tasks, trigger, resolution):
+        if resolution not in self.RESOLUTIONS:
+            raise ValueError(f'Unknown trigger scheduler resolution {resolution!r}, expected one of {", ".join(self.RESOLUTIONS)}')
+        self._logger = logger
+        self._tasks = tasks
+        self._trigger = trigger
+        self._step = self.RESOLUTIONS[resolution]
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='trigger-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _seconds_to_next_tick(self):
+        now = datetime.datetime.now()
+        midnight = datetime.datetime.combine(now.date(), datetime.time())
+        next_tick = midnight + self._step * ((now - midnight) // self._step + 1)
+        return (next_tick - now).total_seconds()
+
+    def check(self):
+        """Trigger due tasks if there are any. Returns whether a trigger ran."""
+        if not self._tasks.has_due_tasks(datetime.date.today()):
+            return False
+        self._trigger()
+        return True
+
+    def _run(self):
+        # Check once at startup to catch up on ticks missed while the app was down.
+        wait_seconds = 0
+        while not self._stop.wait(wait_seconds):
+            try:
+                self.check()
+            except Exception:
+                self._logger.exception('Scheduled task trigger failed')
+            wait_seconds = self._seconds_to_next_tick()
+
+
+class Pipeline:
+    """Runs items through a chain of thread-pool stages joined by bounded queues.
+
+    A full queue blocks the stage feeding it, so a slow later stage throttles the earlier
+    ones instead of letting their output pile up in memory. run() logs and returns each
+    stage's throughput, for sizing worker counts. When items are batches, item_size (e.g.
+    len) makes the stats count what is in them rather than the batches.
+    """
+
+    _DONE = object()
+
+    def __init__(self, logger, name, queue_size=100, item_size=None):
+        self._logger = logger
+        self._name = name
+        self._queue_size = queue_size
+        self._item_size = item_size or (lambda item: 1)
+        self._stages = []
+
+    def add_stage(self, stage_name, handler, workers=1, context=None):
+        """Append a stage. handler(item) returns the next stage's item, or None to drop it.
+
+        context, if given, is called once per worker thread for a context manager to run in,
+        e.g. a Flask app or request context.
+        """
+        self._stages.append((stage_name, handler, workers, context))
+
+    def _work(self, handler, context, inbox, outbox, stats, stats_lock):
+        with context() if context is not None else contextlib.nullcontext():
+            while True:
+                item = inbox.get()
+                if item is self._DONE:
+                    return
+                started = time.monotonic()
+                try:
+                    result = handler(item)
+                except Exception:
+                    self._logger.exception(f'{self._name} pipeline item failed')
+                    result, error = None, True
+                else:
+                    error = False
+                busy_seconds = time.monotonic() - started
+                item_size = self._item_size(item)
+                with stats_lock:
+                    stats['processed'] += item_size
+                    stats['errors'] += item_size if error else 0
+                    stats['busy_seconds'] += busy_seconds
+                if result is not None and outbox is not None:
+                    outbox.put(result)
+
+    def run(self, items):
+        started = time.monotonic()
+        stats_lock = threading.Lock()
+        queues = [queue.Queue(maxsize=self._queue_size) for _ in self._stages]
+        stage_threads = []
+        report = {}
+        for stage_number, (stage_name, handler, workers, context) in enumerate(self._stages):
+            stats = report[stage_name] = {'workers': workers, 'processed': 0, 'errors': 0, 'busy_seconds': 0.0}
+            outbox = queues[stage_number + 1] if stage_number + 1 < len(queues) else None
+            threads = [
+                threading.Thread(
+                    target=self._work,
+                    args=(handler, context, queues[stage_number], outbox, stats, stats_lock),
+                    name=f'{stage_name}-{worker_number}',
+                    daemon=True,
+                    )
+                for worker_number in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            stage_threads.append(threads)
+
+        produced = 0
+        try:
+            for item in items:
+                queues[0].put(item)
+                produced += self._item_size(item)
+        finally:
+            report = {'produce': {'processed': produced, 'seconds': time.monotonic() - started}, **report}
+
+            # Shut stages down in order so each one drains everything the previous one emitted.
+            # This also runs when items raised, so no worker is left waiting on its queue.
+            for stage_queue, threads in zip(queues, stage_threads):
+                for _ in threads:
+                    stage_queue.put(self._DONE)
+                for thread in threads:
+                    thread.join()
+
+        elapsed = time.monotonic() - started
+        for stats in report.values():
+            stats['items_per_second'] = stats['processed'] / elapsed if elapsed else 0.0
+            if stats.get('busy_seconds'):
+                # What the stage could sustain if it never waited on its neighbours; the lowest one is the bottleneck.
+                stats['capacity_per_second'] = stats['workers'] * stats['processed'] / stats['busy_seconds']
+        self._logger.info(f'{self._name} pipeline finished in {elapsed:.1f}s: {report}')
+        return report
+
+
+class NotificationOutbox:
+    """Durable queue of outgoing emails in the notification_outbox table, drained by sender workers.
+
+    Request handlers enqueue() and return; each worker claims a batch, sends it over one
+    MailTransport session, and deletes what was delivered. A failed send is retried with
+    exponential backoff and dead-lettered after max_attempts or a permanent SMTP error. A
+    MailSessionError is not charged to the message: the worker releases the rest of its batch
+    and waits backoff_seconds before trying the server again. Delivery is at-least-once: a
+    worker that dies mid-batch leaves its claims to expire.
+    """
+
+    def __init__(self, logger, pool, transport_factory, sender_address, workers=1, batch_size=20, poll_interval=5,
+                 max_attempts=5, backoff_seconds=60, lease_seconds=300):
+        self._logger = logger
+        self._pool = pool
+        self._transport_factory = transport_factory
+        self._sender_address = sender_address
+        self._workers = workers
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._lease_seconds = lease_seconds
+
+        self._stop = threading.Event()
+        # Set by enqueue so idle workers in this process pick new mail up without waiting a poll interval.
+        self._wake = threading.Event()
+        self._threads = []
+
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._sent = 0
+        self._retried = 0
+        self._dead_lettered = 0
+        self._send_seconds = 0.0
+        self._max_send_seconds = 0.0
+        self._delivery_seconds = 0.0
+        self._max_delivery_seconds = 0.0
+        self.send_seconds = Histogram('taskcur_email_send_duration_seconds', 'SMTP send time per notification attempt.', 'result')
+
+    def enqueue(self, distribution_list, email_subject, body):
+        proc = 'enqueue_notification'
+
+        self._pool.callproc(proc, [','.join(distribution_list), email_subject, body])
+        with self._stats_lock:
+            self._enqueued += 1
+        self._wake.set()
+
+    def start(self):
+        for worker_number in range(self._workers):
+            thread = threading.Thread(target=self._run, name=f'notification-sender-{worker_number}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _claim(self):
+        proc = 'claim_notifications'
+
+        _, proc_rows = self._pool.callproc(proc, [self._batch_size, self._lease_seconds])
+        return proc_rows
+
+    def _send(self, transport, notification_id, created_at, attempts, distribution_list, email_subject, body):
+        started = time.monotonic()
+        try:
+            transport.send(
+                distribution_list=distribution_list.split(','),
+                email_subject=email_subject,
+                sender_address=self._sender_address,
+                body=body,
+                )
+        except MailSessionError:
+            self.send_seconds.observe('failed', time.monotonic() - started)
+            raise
+        except Exception as error:
+            self.send_seconds.observe('failed', time.monotonic() - started)
+            self._fail(notification_id, attempts, error)
+            return
+        send_seconds = time.monotonic() - started
+        self.send_seconds.observe('sent', send_seconds)
+
+        proc = 'complete_notification'
+
+        self._pool.callproc(proc, [notification_id])
+        delivery_seconds = (datetime.datetime.now() - created_at).total_seconds()
+        with self._stats_lock:
+            self._sent += 1
+            self._send_seconds += send_seconds
+            self._max_send_seconds = max(self._max_send_seconds, send_seconds)
+            self._delivery_seconds += delivery_seconds
+            self._max_delivery_seconds = max(self._max_delivery_seconds, delivery_seconds)
+
+    def _fail(self, notification_id, attempts, error):
+        if attempts >= self._max_attempts or is_permanent_smtp_failure(error):
+            retry_at = None
+            self._logger.error(f'Dead-lettering notification {notification_id} after {attempts} attempts: {error}')
+        else:
+            retry_at = datetime.datetime.now() + datetime.timedelta(seconds=self._backoff_seconds * 2 ** (attempts - 1))
+            self._logger.warning(f'Notification {notification_id} failed on attempt {attempts}, retrying at {retry_at}: {error}')
+
+        proc = 'fail_notification'
+
+        self._pool.callproc(proc, [notification_id, str(error)[:1000], retry_at])
+        with self._stats_lock:
+            if retry_at is None:
+                self._dead_lettered += 1
+            else:
+                self._retried += 1
+
+    def _release(self, notifications):
+        """Make claimed notifications due again without counting the claim as an attempt."""
+        proc = 'release_notifications'
+
+        self._pool.callproc(proc, [json.dumps([notification[0] for notification in notifications])])
+
+    def _drain(self, worker_name):
+        """Send batches until none are due. The SMTP session lives as long as the busy spell."""
+        notifications = self._claim()
+        if not notifications:
+            return
+        with self._transport_factory(worker_name) as transport:
+            while notifications:
+                for position, notification in enumerate(notifications):
+                    try:
+                        self._send(transport, *notification)
+                    except MailSessionError:
+                        self._release(notifications[position:])
+                        raise
+                if self._stop.is_set():
+                    return
+                notifications = self._claim()
+
+    def _run(self):
+        worker_name = threading.current_thread().name
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self._drain(worker_name)
+            except MailSessionError as error:
+                self._logger.warning(f'Notification sender paused for {self._backoff_seconds}s: {error}')
+                self._stop.wait(self._backoff_seconds)
+                continue
+            except Exception:
+                self._logger.exception('Notification sender failed')
+            self._wake.wait(self._poll_interval)
+
+    def stats(self):
+        proc = 'get_notification_outbox_stats'
+
+        _, proc_rows = self._pool.callproc(proc)
+        status_counts = {status: (count, oldest_created_at) for status, count, oldest_created_at in proc_rows}
+        pending_count, oldest_pending_at = status_counts.get('pending', (0, None))
+        with self._stats_lock:
+            return {
+                'workers': self._workers,
+                'queue_depth': pending_count,
+                'oldest_pending_seconds': 0.0 if oldest_pending_at is None else (datetime.datetime.now() - oldest_pending_at).total_seconds(),
+                'dead_letters': status_counts.get('dead', (0, None))[0],
+                'enqueued': self._enqueued,
+                'sent': self._sent,
+                'retried': self._retried,
+                'dead_lettered': self._dead_lettered,
+                'mean_send_seconds': self._send_seconds / self._sent if self._sent else 0.0,
+                'max_send_seconds': self._max_send_seconds,
+                'mean_delivery_seconds': self._delivery_seconds / self._sent if self._sent else 0.0,
+                'max_delivery_seconds': self._max_delivery_seconds,
+            }
 
 
 class App:
@@ -410,6 +2189,10 @@ class App:
         self.app.secret_key = os.getenv('FLASK_SECRET_KEY', 'dev-only-change-in-production')
 
         self._logger = logger
+        # Version counters restart with the process and differ between processes, so ETags
+        # carry a per-process salt to keep them from matching a page another process rendered.
+        self._etag_salt = os.urandom(8).hex()
+        self._request_seconds = Histogram('taskcur_http_request_duration_seconds', 'Request handling time per Flask endpoint.', 'endpoint')
 
         db_args = {
             'user': os.getenv('MYSQL_USER'),
@@ -419,10 +2202,43 @@ class App:
             'autocommit': True
         }
 
-        self._conn = connect(**db_args)
+        self._pool = ConnectionPool(
+            logger,
+            db_args,
+            pool_size=int(os.getenv('MYSQL_POOL_SIZE', '5')),
+            checkout_timeout=float(os.getenv('MYSQL_POOL_TIMEOUT', '10')),
+            health_check_interval=float(os.getenv('MYSQL_POOL_HEALTH_CHECK_SECONDS', '30')),
+            )
+
+        change_poll_seconds = float(os.getenv('TASKS_CHANGE_POLL_SECONDS', '0'))
+        trigger_scheduler_resolution = os.getenv('TASKS_TRIGGER_SCHEDULER', '')
+        self._users = Users(logger, self._pool, track_changes=change_poll_seconds > 0)
+        self._tasks = Tasks(
+            logger,
+            self._pool,
+            track_changes=change_poll_seconds > 0,
+            lazy_user_limit=int(os.getenv('TASKS_LAZY_LOAD_USERS', '0')),
+            track_triggers=bool(trigger_scheduler_resolution),
+            task_table_cache_users=int(os.getenv('TASKS_TASK_TABLE_CACHE_USERS', '1000')),
+            )
+
+        self._change_log_poller = None
+        if change_poll_seconds > 0:
+            self._change_log_poller = ChangeLogPoller(
+                logger,
+                self._pool,
+                self._tasks,
+                self._users,
+                change_poll_seconds,
+                retention_hours=float(os.getenv('TASKS_CHANGE_LOG_RETENTION_HOURS', '24')),
+                )
+            self._change_log_poller.start()
 
-        self._users = Users(logger, self._conn)
-        self._tasks = Tasks(logger, self._conn)
+        # Trigger emails link to absolute task URLs, which the scheduler thread builds from this.
+        self._base_url = os.getenv('TASKCUR_BASE_URL', 'http://localhost:8080/')
+        self._trigger_scheduler = None
+        if trigger_scheduler_resolution:
+            self._trigger_scheduler = TriggerScheduler(logger, self._tasks, self._scheduled_task_trigger, trigger_scheduler_resolution)
 
         # Initialize Flask-Login
         self._login_manager = LoginManager()
@@ -434,6 +2250,12 @@ class App:
         def load_user(user_name):
             return self._users.get_user_for_login(user_name)
 
+        self._password_hasher = PasswordHasher(
+            rounds=int(os.getenv('BCRYPT_ROUNDS', '12')),
+            workers=int(os.getenv('BCRYPT_WORKERS', '2')),
+            queue_timeout=float(os.getenv('BCRYPT_QUEUE_TIMEOUT', '10')),
+            )
+
         self._add_endpoints()
 
         self._sender_address = os.getenv('TASKCUR_NOTIFICATIONS_ADDRESS')
@@ -442,6 +2264,20 @@ class App:
         self._smtp_server_port = os.getenv('TASKCUR_NOTIFICATIONS_SMTP_SERVER_PORT')
         self._smtp_server_password = os.getenv('TASKCUR_NOTIFICATIONS_SMTP_SERVER_PASSWORD')
 
+        self._notification_outbox = NotificationOutbox(
+            logger,
+            self._pool,
+            self._mail_transport,
+            self._sender_address,
+            workers=int(os.getenv('TASKS_NOTIFICATION_WORKERS', '1')),
+            max_attempts=int(os.getenv('TASKS_NOTIFICATION_MAX_ATTEMPTS', '5')),
+            backoff_seconds=float(os.getenv('TASKS_NOTIFICATION_BACKOFF_SECONDS', '60')),
+            )
+        self._notification_outbox.start()
+
+        if self._trigger_scheduler is not None:
+            self._trigger_scheduler.start()
+
     
     def _add_endpoints(self):
         self.app.add_url_rule(rule='/', view_func=self._index)
@@ -463,6 +2299,7 @@ class App:
         self.app.add_url_rule(rule='/user/<user_name>/delete', endpoint='/user/<user_name>/delete', view_func=self._delete_user, methods=['POST', 'GET'])
         self.app.add_url_rule(rule='/user/<user_name>/update-home', endpoint='/user/<user_name>/update-home', view_func=self._update_user_home, methods=['POST', 'GET'])
         self.app.add_url_rule(rule='/user/<user_name>/update', endpoint='/user/<user_name>/update', view_func=self._update_user, methods=['POST', 'GET'])
+        self.app.add_url_rule(rule='/user/<user_name>/search', endpoint='/user/<user_name>/search', view_func=self._search_tasks, methods=['GET'])
 
 
         self.app.add_url_rule(rule='/task/<task_id>', endpoint='/task/<task_id>', view_func=self._task_home, methods=['POST', 'GET'])
@@ -478,8 +2315,18 @@ class App:
         self.app.add_url_rule(rule='/weekly-summary', endpoint='/weekly-summary', view_func=self._weekly_summary, methods=['POST', 'GET'])
         self.app.add_url_rule(rule='/daily-task-trigger', endpoint='/daily-task-trigger', view_func=self._daily_task_trigger, methods=['POST', 'GET'])
         self.app.add_url_rule(rule='/purge-inactive-users', endpoint='/purge-inactive-users', view_func=self._purge_inactive_users, methods=['POST', 'GET'])
-
+        self.app.add_url_rule(rule='/refresh-cache', endpoint='/refresh-cache', view_func=self._refresh_cache, methods=['POST', 'GET'])
+        self.app.add_url_rule(rule='/api/user/<user_name>/tasks', endpoint='/api/user/<user_name>/tasks', view_func=self._api_user_tasks, methods=['GET'])
+        self.app.add_url_rule(rule='/api/user/<user_name>/tasks/search', endpoint='/api/user/<user_name>/tasks/search', view_func=self._api_search_tasks, methods=['GET'])
+        self.app.add_url_rule(rule='/api/user/<user_name>/tasks/import', endpoint='/api/user/<user_name>/tasks/import', view_func=self._api_import_tasks, methods=['POST'])
+        self.app.add_url_rule(rule='/api/user/<user_name>/tasks/export', endpoint='/api/user/<user_name>/tasks/export', view_func=self._api_export_tasks, methods=['GET'])
+        self.app.add_url_rule(rule='/notification-outbox-stats', endpoint='/notification-outbox-stats', view_func=self._notification_outbox_stats, methods=['GET'])
+        self.app.add_url_rule(rule='/metrics', endpoint='/metrics', view_func=self._metrics, methods=['GET'])
+
+        self.app.before_request(self._start_request_timer)
+        self.app.teardown_request(self._observe_request_time)
         self.app.after_request(self._add_response_headers)
+        self.app.register_error_handler(PasswordHasherBusyError, self._password_hasher_busy)
 
     def _check_auth(self, user_name=None):
         """Check if user is authenticated and optionally if they match user_name."""
@@ -512,11 +2359,28 @@ class App:
     def _index(self):
         return redirect('/login')
 
+    def _conditional_page(self, etag_parts, render, private=True):
+        """Render a GET page, or answer 304 when the client's copy still matches etag_parts.
+
+        etag_parts must change whenever the page would. Pages with a flash message pending are
+        rendered every time and stay uncacheable, since rendering consumes the message.
+        """
+        if request.method not in ('GET', 'HEAD') or '_flashes' in session:
+            return render()
+        etag = hashlib.sha1(repr((self._etag_salt, request.full_path, request.url_root, *etag_parts)).encode('utf-8')).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            response = make_response(render())
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache' if private else 'no-cache'
+        return response
+
     def _login_home(self):
-        return render_template('login.html')
+        return self._conditional_page(('login',), lambda: render_template('login.html'), private=False)
     
     def _create_user_home(self):
-        return render_template('create_user.html')
+        return self._conditional_page(('create-user',), lambda: render_template('create_user.html'), private=False)
     
     def _update_user_home(self, user_name):
         auth_redirect = self._check_auth(user_name)
@@ -534,6 +2398,7 @@ class App:
         if auth_redirect:
             return auth_redirect
         self._users.update_user(user_name, **request.form)
+        self._tasks.invalidate_task_tables(user_name)
         user_info = self._users.get_user_info(user_name)
         flash(f'User Updated')
         return render_template(
@@ -620,6 +2485,14 @@ class App:
         auth_redirect = self._check_task_ownership(task_id)
         if auth_redirect:
             return auth_redirect
+        # Ownership is checked, so the task's versions are the logged-in user's.
+        user_name = current_user.user_name
+        return self._conditional_page(
+            ('task', self._tasks.get_user_version(user_name)),
+            lambda: self._render_task_home(task_id),
+            )
+
+    def _render_task_home(self, task_id):
         task_info = self._tasks.get_task_info(task_id)
         task_info['task_description'] = task_info['task_description'].replace('\r\n', '<br>')
         if task_info['status'] == 'scheduled':
@@ -633,11 +2506,30 @@ class App:
             **task_info
             )
     
+    def _search_tasks(self, user_name):
+        auth_redirect = self._check_auth(user_name)
+        if auth_redirect:
+            return auth_redirect
+        query = request.args.get('q', '').strip()
+        status = request.args.get('status') or None
+        if status not in (None, 'open', 'scheduled', 'closed'):
+            status = None
+        results_html = None
+        if query:
+            matches = self._tasks.search_tasks(user_name, query, status)
+            # Results of every status show their created date, as the open table does.
+            results_html = render_task_table(task_table_rows([task for task, _ in matches], 'open'), 'open')
+        return render_template('search_tasks.html', user_name=user_name, query=query, status=status, results=results_html)
+
     def _create_task_home(self, user_name):
         auth_redirect = self._check_auth(user_name)
         if auth_redirect:
             return auth_redirect
-        return render_template('create_task.html', user_name=user_name, min_date=tomorrow())
+        min_date = tomorrow()
+        return self._conditional_page(
+            ('create-task', min_date),
+            lambda: render_template('create_task.html', user_name=user_name, min_date=min_date),
+            )
 
     def _create_task(self, user_name):
         auth_redirect = self._check_auth(user_name)
@@ -652,7 +2544,7 @@ class App:
         password = request.form.get('password', '')
         next_url = request.args.get('next')
 
-        if user_name not in self._users.user_info.index:
+        if user_name not in self._users.user_info:
             flash(f'User ID, {user_name}, does not exist. Enter another ID or create a new one.')
             return render_template('login.html')
 
@@ -662,22 +2554,32 @@ class App:
             flash('Please set your password to continue.')
             return redirect(url_for('set-password', user_name=user_name))
 
-        if not user.check_password(password):
+        if not self._password_hasher.check_password(password, user.password_hash):
             flash('Invalid password. Please try again.')
             return render_template('login.html')
 
+        if self._password_hasher.needs_rehash(user.password_hash):
+            # The password is only known here, so hashes move to a new BCRYPT_ROUNDS as users log in.
+            self._logger.info(f'Rehashing password for user, {user_name}, at {self._password_hasher.rounds} rounds')
+            self._users.set_user_password(user_name, self._password_hasher.hash_password(password))
+
         login_user(user, remember=True)
+        self._tasks.load_user(user_name)
         if next_url and is_safe_redirect_url(next_url):
             return redirect(next_url)
         return redirect(f'/user/{user_name}')
 
+    def _password_hasher_busy(self, error):
+        self._logger.warning(str(error))
+        return ('Too many sign-ins right now, please try again shortly.', 503, {'Retry-After': '5'})
+
     def _logout(self):
         logout_user()
         flash('You have been logged out.')
         return redirect('/login')
 
     def _set_password_home(self, user_name):
-        if user_name not in self._users.user_info.index:
+        if user_name not in self._users.user_info:
             flash('User not found.')
             return redirect('/login')
         return render_template('set_password.html', user_name=user_name)
@@ -694,7 +2596,7 @@ class App:
             flash('Passwords do not match.')
             return render_template('set_password.html', user_name=user_name)
 
-        password_hash = User.hash_password(password)
+        password_hash = self._password_hasher.hash_password(password)
         self._users.set_user_password(user_name, password_hash)
 
         user = self._users.get_user_for_login(user_name)
@@ -706,7 +2608,7 @@ class App:
         if not current_user.is_authenticated:
             flash('Please log in to access this page.')
             return redirect('/login')
-        if user_name not in self._users.user_info.index:
+        if user_name not in self._users.user_info:
             flash('User not found.')
             return redirect(f'/user/{current_user.user_name}')
         return render_template('reset_password.html', user_name=user_name)
@@ -715,7 +2617,7 @@ class App:
         if not current_user.is_authenticated:
             flash('Please log in to access this page.')
             return redirect('/login')
-        if user_name not in self._users.user_info.index:
+        if user_name not in self._users.user_info:
             flash('User not found.')
             return redirect(f'/user/{current_user.user_name}')
 
@@ -730,7 +2632,7 @@ class App:
             flash('Passwords do not match.')
             return render_template('reset_password.html', user_name=user_name)
 
-        password_hash = User.hash_password(password)
+        password_hash = self._password_hasher.hash_password(password)
         self._users.set_user_password(user_name, password_hash)
         flash(f'Password reset successfully for {user_name}.')
         return redirect(f'/user/{current_user.user_name}')
@@ -751,7 +2653,7 @@ class App:
         confirm_password = request.form.get('confirm_password', '')
 
         user = self._users.get_user_for_login(user_name)
-        if not user.check_password(current_password):
+        if not self._password_hasher.check_password(current_password, user.password_hash):
             flash('Current password is incorrect.')
             return render_template('change_password.html', user_name=user_name)
 
@@ -763,7 +2665,7 @@ class App:
             flash('New passwords do not match.')
             return render_template('change_password.html', user_name=user_name)
 
-        password_hash = User.hash_password(new_password)
+        password_hash = self._password_hasher.hash_password(new_password)
         self._users.set_user_password(user_name, password_hash)
         flash('Password changed successfully.')
         return redirect(f'/user/{user_name}')
@@ -773,6 +2675,13 @@ class App:
         if auth_redirect:
             return auth_redirect
         user_info = self._users.get_user_info(user_name)
+        # updated_at also covers preference changes made by other processes.
+        return self._conditional_page(
+            ('user', self._tasks.get_user_version(user_name), user_info['updated_at']),
+            lambda: self._render_user_home(user_name, user_info),
+            )
+
+    def _render_user_home(self, user_name, user_info):
         closed_task_display_count_preference = user_info['closed_task_display_count_preference']
         open_task_html = self._tasks.get_task_table_for_user_and_status(user_name, closed_task_display_count_preference, 'open')
         scheduled_task_html = self._tasks.get_task_table_for_user_and_status(user_name, closed_task_display_count_preference, 'scheduled')
@@ -785,9 +2694,21 @@ class App:
             closed_tasks=closed_task_html,
             )
     
+    def _start_request_timer(self):
+        g.request_started = time.perf_counter()
+
+    def _observe_request_time(self, error):
+        # Teardown runs for failed requests too, so errors are timed along with successes.
+        started = g.pop('request_started', None)
+        if started is not None:
+            self._request_seconds.observe(request.endpoint or 'unmatched', time.perf_counter() - started)
+
     def _add_response_headers(self, response):
-        response.headers['Cache-Control'] = 'no-cache, no-store'
-        response.headers['Pragma'] = 'no-cache'
+        # Pages from _conditional_page carry an ETag and their own Cache-Control; everything
+        # else, mutations and redirects included, stays uncacheable.
+        if response.get_etag()[0] is None:
+            response.headers['Cache-Control'] = 'no-cache, no-store'
+            response.headers['Pragma'] = 'no-cache'
         return response
     
     def _create_user(self):
@@ -807,7 +2728,7 @@ class App:
 
         valid_new_user_info, message = self._validate_new_user_info(**form)
         if valid_new_user_info:
-            form['password_hash'] = User.hash_password(password)
+            form['password_hash'] = self._password_hasher.hash_password(password)
             self._users.add_user(**form)
             user_name = form['user_name']
             user = self._users.get_user_for_login(user_name)
@@ -821,7 +2742,7 @@ class App:
         valid_new_user_info = False
         user_name = kwargs.get('user_name')
         email_address = kwargs.get('email_address')
-        if user_name in self._users.user_info.index:
+        if user_name in self._users.user_info:
             message = f'User ID, {user_name}, already exists. Enter another ID.'
         elif not self._validate_user_name(user_name):
             message = f'Invalid User Name: {user_name}'
@@ -877,15 +2798,48 @@ class App:
             return auth_redirect
         logout_user()
         self._users.delete_user(user_name)
+        self._tasks.forget_user(user_name)
         return redirect('/login')
 
-    def _weekly_summary_for_user(self, user_name):
-        user_info = self._users.get_user_info(user_name)
+    def _mail_transport(self, run_name):
+        return MailTransport(
+            self._logger,
+            run_name,
+            smtp_server=self._smtp_server,
+            smtp_server_port=self._smtp_server_port,
+            smtp_server_user=self._smtp_server_user,
+            smtp_server_password=self._smtp_server_password,
+            )
+
+    def _weekly_summary_recipients(self):
+        task_counts = self._tasks.get_task_counts_by_user()
+        for user_name, user_info in self._users.get_users():
+            if user_info['summary_notification_preference'] != 'weekly:friday':
+                continue
+            status_counts = task_counts.get(user_name, {})
+            # Users with nothing open or scheduled get no summary, so skip them before rendering.
+            if status_counts.get('open', 0) + status_counts.get('scheduled', 0) == 0:
+                continue
+            yield user_name, user_info
+
+    def _render_weekly_summaries(self, recipients):
+        # The batch's tasks come from one lookup and are rendered without the task table cache,
+        # so a run over every user neither evicts active users' tasks nor fills the cache.
+        tasks_by_user = self._tasks.get_tasks_for_users([user_name for user_name, _ in recipients])
+        summaries = []
+        for user_name, user_info in recipients:
+            try:
+                summaries.append(self._render_weekly_summary(user_name, user_info, tasks_by_user[user_name]))
+            except Exception:
+                self._logger.exception(f'Weekly summary for user, {user_name}, failed to render')
+        return summaries
+
+    def _render_weekly_summary(self, user_name, user_info, tasks):
         closed_task_display_count_preference = user_info['closed_task_display_count_preference']
-        email_address = user_info['email_address'].split(',')
-        open_task_html = self._tasks.get_task_table_for_user_and_status(user_name, closed_task_display_count_preference, 'open')
-        scheduled_task_html = self._tasks.get_task_table_for_user_and_status(user_name, closed_task_display_count_preference, 'scheduled')
-        closed_task_html = self._tasks.get_task_table_for_user_and_status(user_name, closed_task_display_count_preference, 'closed')
+        open_task_html, scheduled_task_html, closed_task_html = (
+            render_task_table(task_table_rows(Tasks.order_for_task_table(tasks, closed_task_display_count_preference, status), status), status)
+            for status in ('open', 'scheduled', 'closed')
+            )
         summary_html = render_template(
             'user_summary.html', 
             user_name=user_name,
@@ -893,41 +2847,58 @@ class App:
             scheduled_tasks=scheduled_task_html,
             closed_tasks=closed_task_html,
             )
-        open_task_count = len(self._tasks.get_tasks_for_user(user_name, 'open'))
-        scheduled_task_count = len(self._tasks.get_tasks_for_user(user_name, 'scheduled'))
-        if open_task_count + scheduled_task_count > 0:
-            send_mail(
-                distribution_list=email_address, 
-                email_subject=f'TaskCur Summary for {user_name}',
-                sender_address=self._sender_address,
-                smtp_server=self._smtp_server,
-                smtp_server_user=self._smtp_server_user,
-                smtp_server_port=self._smtp_server_port,
-                smtp_server_password=self._smtp_server_password,
-                body=summary_html,
-                )
+        return user_name, user_info['email_address'].split(','), summary_html
+
+    def _send_weekly_summaries(self, summaries):
+        for summary in summaries:
+            try:
+                self._send_weekly_summary(summary)
+            except Exception:
+                self._logger.exception(f'Weekly summary for user, {summary[0]}, failed to queue')
+
+    def _send_weekly_summary(self, summary):
+        user_name, email_address, summary_html = summary
+        self._notification_outbox.enqueue(
+            distribution_list=email_address, 
+            email_subject=f'TaskCur Summary for {user_name}',
+            body=summary_html,
+            )
 
     def _weekly_summary(self):
-        for user_name, user_info in self._users.user_info.iterrows():
-            if user_info['summary_notification_preference'] == 'weekly:friday':
-                self._weekly_summary_for_user(user_name)
-        return ('', 204)
+        # Render workers run outside this request, so they get their own with the same URL root.
+        url_root = request.url_root
+        # Stages pass batches of recipients, so the queues hold TASKS_SUMMARY_QUEUE_SIZE summaries' worth of batches.
+        queue_size = max(1, int(os.getenv('TASKS_SUMMARY_QUEUE_SIZE', '100')) // WEEKLY_SUMMARY_BATCH_SIZE)
+        # Stats count recipients rather than batches, to size worker counts against.
+        pipeline = Pipeline(self._logger, 'Weekly summary', queue_size=queue_size, item_size=len)
+        pipeline.add_stage(
+            'render',
+            self._render_weekly_summaries,
+            workers=int(os.getenv('TASKS_SUMMARY_RENDER_WORKERS', '4')),
+            context=lambda: self.app.test_request_context(base_url=url_root),
+            )
+        pipeline.add_stage('send', self._send_weekly_summaries, workers=int(os.getenv('TASKS_SUMMARY_SEND_WORKERS', '2')))
+        pipeline.run(batched(self._weekly_summary_recipients(), WEEKLY_SUMMARY_BATCH_SIZE))
+        # Emails are sent by the notification outbox workers.
+        return ('', 202)
 
     def _daily_task_trigger(self):
+        self._trigger_due_tasks()
+        return ('', 202)
+
+    def _scheduled_task_trigger(self):
+        # Outside a request, so the trigger email's url_for(_external=True) needs one to build links from.
+        with self.app.test_request_context(base_url=self._base_url):
+            self._trigger_due_tasks()
+
+    def _trigger_due_tasks(self):
         today = datetime.date.today()
-        triggered_tasks = self._tasks.task_info.loc[self._tasks.task_info['trigger_date'] <= today, ]
-        for task_id, triggered_task_info in triggered_tasks.iterrows():
-            self._tasks.update_task(
-                task_id=task_id, 
-                task_title=triggered_task_info['task_title'], 
-                task_description=triggered_task_info['task_description'], 
-                trigger_date=''
-                )
+        for triggered_task in self._tasks.trigger_due_tasks(today):
+            task_id, triggered_task_info = triggered_task.task_id, triggered_task.to_dict()
             user_name = triggered_task_info['user_name']
             user_info = self._users.get_user_info(user_name)
             if user_info['trigger_notification_preference'] == 'email':
                 self._send_task_trigger_email(task_id, triggered_task_info)
-        return ('', 204)
 
     def _send_task_trigger_email(self, task_id, triggered_task_info):
         user_name = triggered_task_info['user_name']
@@ -939,24 +2910,193 @@ class App:
             task_title=triggered_task_info['task_title'],
             task_description=triggered_task_info['task_description'],
             )
-        send_mail(
+        self._notification_outbox.enqueue(
             distribution_list=email_address, 
             email_subject=f"Task Triggered: {triggered_task_info['task_title']}",
-            sender_address=self._sender_address,
-            smtp_server=self._smtp_server,
-            smtp_server_user=self._smtp_server_user,
-            smtp_server_port=self._smtp_server_port,
-            smtp_server_password=self._smtp_server_password,
             body=trigger_html,
             )
     
+    def _check_api_auth(self, user_name):
+        """Like _check_auth, but answers API clients with a JSON error instead of a login redirect."""
+        if not current_user.is_authenticated:
+            return jsonify(error='Log in to use the API.'), 401
+        if current_user.user_name != user_name:
+            return jsonify(error=f'These tasks belong to {user_name}.'), 403
+        return None
+
+    def _api_user_tasks(self, user_name):
+        auth_error = self._check_api_auth(user_name)
+        if auth_error:
+            return auth_error
+
+        status = request.args.get('status') or None
+        if status not in (None, 'open', 'scheduled', 'closed'):
+            return jsonify(error='status must be open, scheduled or closed.'), 400
+        try:
+            after = int(request.args.get('after', 0))
+            limit = int(request.args.get('limit', API_PAGE_SIZE))
+        except ValueError:
+            return jsonify(error='after and limit must be integers.'), 400
+        if not 1 <= limit <= API_MAX_PAGE_SIZE:
+            return jsonify(error=f'limit must be between 1 and {API_MAX_PAGE_SIZE}.'), 400
+
+        tasks, has_more = self._tasks.get_task_page(user_name, status, after, limit)
+        next_after = tasks[-1].task_id if has_more else None
+
+        def generate():
+            # Serialised one task at a time so a large page is never held as one string.
+            yield '{"tasks": ['
+            for position, task in enumerate(tasks):
+                yield (',' if position else '') + json.dumps({'task_id': task.task_id, **task.to_dict()}, default=lambda value: value.isoformat())
+            yield f'], "next_after": {json.dumps(next_after)}}}'
+
+        return Response(generate(), mimetype='application/json')
+
+    def _api_search_tasks(self, user_name):
+        auth_error = self._check_api_auth(user_name)
+        if auth_error:
+            return auth_error
+
+        query = request.args.get('q', '').strip()
+        status = request.args.get('status') or None
+        if not query:
+            return jsonify(error='q is required.'), 400
+        if status not in (None, 'open', 'scheduled', 'closed'):
+            return jsonify(error='status must be open, scheduled or closed.'), 400
+        try:
+            limit = int(request.args.get('limit', SEARCH_RESULT_LIMIT))
+        except ValueError:
+            return jsonify(error='limit must be an integer.'), 400
+        if not 1 <= limit <= API_MAX_PAGE_SIZE:
+            return jsonify(error=f'limit must be between 1 and {API_MAX_PAGE_SIZE}.'), 400
+
+        matches = self._tasks.search_tasks(user_name, query, status, limit)
+        return Response(
+            json.dumps({'tasks': [{'task_id': task.task_id, 'score': score, **task.to_dict()} for task, score in matches]}, default=lambda value: value.isoformat()),
+            mimetype='application/json',
+            )
+
+    def _api_import_tasks(self, user_name):
+        auth_error = self._check_api_auth(user_name)
+        if auth_error:
+            return auth_error
+
+        # Either a multipart upload named tasks_file or the raw request body.
+        if 'tasks_file' in request.files:
+            upload = request.files['tasks_file']
+            stream = upload.stream
+            file_format = 'csv' if upload.filename.lower().endswith('.csv') else 'ndjson'
+        else:
+            stream = request.stream
+            file_format = 'csv' if request.mimetype == 'text/csv' else 'ndjson'
+
+        started = time.monotonic()
+        imported = 0
+        try:
+            for batch in batched(iter_task_rows(stream, file_format), IMPORT_BATCH_SIZE):
+                imported += self._tasks.add_tasks(user_name, batch)
+        except (ValueError, csv.Error) as error:
+            # Earlier batches are already committed; report how far the import got.
+            return jsonify(error=str(error), imported=imported), 400
+        seconds = time.monotonic() - started
+        rows_per_second = imported / seconds if seconds else 0.0
+        self._logger.info(f'Imported {imported} tasks for user, {user_name}, at {rows_per_second:.0f} rows/s')
+        return jsonify(imported=imported, seconds=seconds, rows_per_second=rows_per_second)
+
+    def _api_export_tasks(self, user_name):
+        auth_error = self._check_api_auth(user_name)
+        if auth_error:
+            return auth_error
+
+        file_format = request.args.get('format', 'csv')
+        if file_format not in ('csv', 'ndjson'):
+            return jsonify(error='format must be csv or ndjson.'), 400
+        # Records are replaced rather than mutated on write, so this is a consistent snapshot
+        # of references; the rows themselves are formatted one at a time as the client reads.
+        tasks = sorted(self._tasks.get_tasks_for_user(user_name), key=lambda task: task.task_id)
+
+        def generate_csv():
+            line = io.StringIO()
+            writer = csv.writer(line)
+            for row in itertools.chain([EXPORT_COLUMNS], ([getattr(task, column) for column in EXPORT_COLUMNS] for task in tasks)):
+                writer.writerow(row)
+                yield line.getvalue()
+                line.seek(0)
+                line.truncate()
+
+        def generate_ndjson():
+            for task in tasks:
+                yield json.dumps({column: getattr(task, column) for column in EXPORT_COLUMNS}, default=lambda value: value.isoformat()) + '\n'
+
+        if file_format == 'csv':
+            response = Response(generate_csv(), mimetype='text/csv')
+        else:
+            response = Response(generate_ndjson(), mimetype='application/x-ndjson')
+        response.headers['Content-Disposition'] = f'attachment; filename="{user_name}_tasks.{file_format}"'
+        return response
+
+    def _notification_outbox_stats(self):
+        return jsonify(self._notification_outbox.stats())
+
+    def _metrics(self):
+        pool_stats = self._pool.stats()
+        task_table_stats = self._tasks.task_table_cache_stats()
+        outbox_stats = self._notification_outbox.stats()
+        hasher_stats = self._password_hasher.stats()
+        lines = [
+            *self._request_seconds.render(),
+            *self._pool.proc_seconds.render(),
+            *format_metric('taskcur_db_pool_open_connections', 'gauge', 'Open pooled database connections.', pool_stats['open_connections']),
+            *format_metric('taskcur_db_pool_idle_connections', 'gauge', 'Idle pooled database connections.', pool_stats['idle_connections']),
+            *format_metric('taskcur_db_pool_checkouts_total', 'counter', 'Connection checkouts from the pool.', pool_stats['checkouts']),
+            *format_metric('taskcur_db_pool_wait_seconds_total', 'counter', 'Time spent waiting for a pooled connection.', pool_stats['wait_seconds_total']),
+            *format_metric('taskcur_db_pool_timeouts_total', 'counter', 'Checkouts that gave up waiting for a connection.', pool_stats['timeouts']),
+            *format_metric('taskcur_db_reconnects_total', 'counter', 'Stale pooled connections reconnected.', pool_stats['reconnects']),
+            *format_metric('taskcur_cache_records', 'gauge', 'Records held in the in-memory caches.', {
+                (('cache', 'task_info'),): len(self._tasks.task_info),
+                (('cache', 'user_info'),): len(self._users.user_info),
+                }),
+            *format_metric('taskcur_task_table_cache_tables', 'gauge', 'Rendered task tables held in the cache.', task_table_stats['tables']),
+            *format_metric('taskcur_task_table_cache_requests_total', 'counter', 'Task table cache lookups.', {
+                (('result', 'hit'),): task_table_stats['hits'],
+                (('result', 'miss'),): task_table_stats['misses'],
+                }),
+            *self._notification_outbox.send_seconds.render(),
+            *format_metric('taskcur_notifications_total', 'counter', 'Notifications handled by this process.', {
+                (('event', 'enqueued'),): outbox_stats['enqueued'],
+                (('event', 'sent'),): outbox_stats['sent'],
+                (('event', 'retried'),): outbox_stats['retried'],
+                (('event', 'dead_lettered'),): outbox_stats['dead_lettered'],
+                }),
+            *format_metric('taskcur_notification_queue_depth', 'gauge', 'Pending notifications in the outbox.', outbox_stats['queue_depth']),
+            *format_metric('taskcur_notification_oldest_pending_seconds', 'gauge', 'Age of the oldest pending notification.', outbox_stats['oldest_pending_seconds']),
+            *format_metric('taskcur_notification_dead_letters', 'gauge', 'Dead-lettered notifications in the outbox.', outbox_stats['dead_letters']),
+            *self._password_hasher.bcrypt_seconds.render(),
+            *format_metric('taskcur_bcrypt_queue_seconds_total', 'counter', 'Time spent waiting for a bcrypt slot.', hasher_stats['queue_seconds_total']),
+            *format_metric('taskcur_bcrypt_rejections_total', 'counter', 'bcrypt calls rejected after the queue timeout.', hasher_stats['rejections']),
+            ]
+        if self._change_log_poller is not None:
+            poller_stats = self._change_log_poller.stats()
+            lines += [
+                *format_metric('taskcur_change_log_staleness_seconds', 'gauge', 'Time since the last successful change log poll.', poller_stats['staleness_seconds']),
+                *format_metric('taskcur_change_log_errors_total', 'counter', 'Failed change log polls.', poller_stats['errors']),
+                *format_metric('taskcur_change_log_changes_applied_total', 'counter', 'Changes applied from the change log.', poller_stats['changes_applied']),
+                *format_metric('taskcur_change_log_changes_purged_total', 'counter', 'Change log rows deleted after the retention.', poller_stats['changes_purged']),
+                ]
+        return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
     def _purge_inactive_users(self):
         self._users._purge_inactive_users()
         return ('', 204)
 
+    def _refresh_cache(self):
+        self._users.refresh()
+        self._tasks.refresh()
+        return ('', 204)
+
     def serve(self):
         from waitress import serve
-        serve(self.app, host='0.0.0.0', port=8080, threads=1)
+        serve(self.app, host='0.0.0.0', port=8080, threads=int(os.getenv('TASKS_SERVE_THREADS', '4')))
 
     def run(self, debug=False):
         self.app.run(debug=debug)
@@ -0,0 +1 @@
+"""Benchmarks for the Tasks app. Run each module from the repository root, e.g. `python -m benchmarks.task_table`."""
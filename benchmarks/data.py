@@ -0,0 +1,78 @@
+"""
+Synthetic users and tasks for benchmarks.
+
+Tasks are spread over users with a Zipf-like skew, so a few heavy users own a large share
+of them, as in production. Rows come out in the column order of UserRecord and TaskRecord
+and are fully determined by the arguments, so a given size and seed always produce the
+same data.
+"""
+import bisect
+import datetime
+import itertools
+import random
+
+import bcrypt
+
+PASSWORD = 'benchmark-password'
+
+# Share of tasks in each status; scheduled tasks fall from a week ago to two months out,
+# so every benchmark run finds some due.
+STATUS_WEIGHTS = {'open': 0.3, 'scheduled': 0.1, 'closed': 0.6}
+SCHEDULED_DAYS = (-7, 60)
+HISTORY_DAYS = 365
+
+_DRAW_BATCH_SIZE = 100000
+
+
+def user_name(user_number):
+    return f'user{user_number}'
+
+
+def user_cumulative_weights(user_count, skew):
+    """Cumulative weights of user_number 0..user_count-1 owning a task; user 0 is the heaviest."""
+    return list(itertools.accumulate(1 / (rank ** skew) for rank in range(1, user_count + 1)))
+
+
+def draw_user_numbers(rng, cumulative_weights, count):
+    """Draw `count` task owners from the skewed distribution."""
+    total = cumulative_weights[-1]
+    for _ in range(count):
+        yield bisect.bisect_left(cumulative_weights, rng.random() * total)
+
+
+def generate_users(user_count, now):
+    # One cheap hash shared by every user, so generating users never waits on bcrypt.
+    password_hash = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt(4)).decode('utf-8')
+    for user_number in range(user_count):
+        name = user_name(user_number)
+        yield (name, now, now, f'{name}@example.com', 'weekly:friday', 'email', 5, password_hash)
+
+
+def generate_tasks(task_count, user_count, now, skew=1.0, seed=0):
+    rng = random.Random(seed)
+    cumulative_weights = user_cumulative_weights(user_count, skew)
+    statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+    today = now.date()
+    task_id = 0
+    for batch_start in range(0, task_count, _DRAW_BATCH_SIZE):
+        batch_size = min(_DRAW_BATCH_SIZE, task_count - batch_start)
+        batch_statuses = rng.choices(statuses, weights=status_weights, k=batch_size)
+        for user_number, status in zip(draw_user_numbers(rng, cumulative_weights, batch_size), batch_statuses):
+            task_id += 1
+            created_at = now - datetime.timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400))
+            updated_at = created_at
+            trigger_date = None
+            if status == 'scheduled':
+                trigger_date = today + datetime.timedelta(days=rng.randint(*SCHEDULED_DAYS))
+            elif status == 'closed':
+                updated_at = created_at + (now - created_at) * rng.random()
+            yield (
+                task_id,
+                created_at,
+                updated_at,
+                user_name(user_number),
+                f'Task {task_id}',
+                f'Synthetic task {task_id}\r\nfor {user_name(user_number)}',
+                trigger_date,
+                status,
+                )
@@ -0,0 +1,182 @@
+"""
+MailTransport checks against a local aiosmtpd server standing in for the SMTP relay.
+
+Sends through app.MailTransport to an aiosmtpd Controller whose replies are scripted per
+scenario, and checks that:
+
+- a 421 at the server's per-session message limit reconnects and resends the message;
+- report() counts the messages sent, failures and connections;
+- a refused recipient or a 5xx answer to DATA fails that message as a permanent failure
+  and leaves the session usable for the next one;
+- a refused login or sender address, and a session that drops again after reconnecting,
+  raise MailSessionError.
+
+Exits non-zero if any check fails. Needs aiosmtpd (pip install aiosmtpd), which the app
+itself does not use.
+
+Usage:
+    python -m benchmarks.mail_transport [--port N] [--messages N] [--session-limit N]
+"""
+import argparse
+import logging
+import smtplib
+import sys
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+import app
+
+SENDER_ADDRESS = 'notifications@example.com'
+REFUSED_SENDER_ADDRESS = 'refused@example.com'
+REFUSED_RECIPIENT = 'refused@example.com'
+REJECTED_SUBJECT = 'Rejected'
+
+
+class ScriptedRelay:
+    """aiosmtpd handler that accepts mail until a scripted refusal.
+
+    It closes each session with a 421 after session_limit messages, refuses
+    REFUSED_SENDER_ADDRESS and REFUSED_RECIPIENT, and answers DATA for REJECTED_SUBJECT
+    with a 554. With drop_every_session, every DATA gets a 421.
+    """
+
+    def __init__(self, session_limit):
+        self.session_limit = session_limit
+        self.drop_every_session = False
+        self.accept_logins = True
+        self.delivered = []
+        self._session_counts = {}
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        # handled=False makes aiosmtpd answer a refused login with 535 instead of leaving it to the handler.
+        return AuthResult(success=self.accept_logins, handled=False)
+
+    async def handle_MAIL(self, server, session, envelope, address, mail_options):
+        if address == REFUSED_SENDER_ADDRESS:
+            return '553 5.7.1 Sender address not allowed'
+        envelope.mail_from = address
+        envelope.mail_options.extend(mail_options)
+        return '250 OK'
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address == REFUSED_RECIPIENT:
+            return '550 5.1.1 No such user'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.drop_every_session:
+            return '421 4.3.2 Service shutting down'
+        if f'Subject: {REJECTED_SUBJECT}' in envelope.content.decode('utf-8', 'replace'):
+            return '554 5.6.0 Message rejected'
+        session_count = self._session_counts.get(id(session), 0)
+        if session_count >= self.session_limit:
+            return '421 4.7.0 Too many messages in this session'
+        self._session_counts[id(session)] = session_count + 1
+        self.delivered.append(envelope.content)
+        return '250 OK'
+
+
+def expect_error(failures, name, error_type, send):
+    """Run send() and record a failure unless it raises error_type; returns the error."""
+    try:
+        send()
+    except error_type as error:
+        return error
+    except Exception as error:
+        failures.append(f'{name}: raised {error!r}, expected {error_type.__name__}')
+        return None
+    failures.append(f'{name}: did not raise {error_type.__name__}')
+    return None
+
+
+def check_reconnect(logger, relay, port, message_count, failures):
+    """A 421 at the session limit reconnects once and resends; report() counts it all."""
+    with app.MailTransport(logger, 'Reconnect check', '127.0.0.1', port, 'user', 'password') as transport:
+        for message_number in range(message_count):
+            try:
+                transport.send(['user@example.com'], f'Message {message_number}', SENDER_ADDRESS, f'<p>Message {message_number}</p>')
+            except Exception as error:
+                failures.append(f'reconnect: message {message_number} failed: {error!r}')
+        report = transport.report()
+    expected_connections = -(-message_count // relay.session_limit)
+    print(f'reconnect: {report}')
+    if len(relay.delivered) != message_count:
+        failures.append(f'reconnect: relay received {len(relay.delivered)} messages, expected {message_count}')
+    if report['messages_sent'] != message_count or report['failures'] != 0:
+        failures.append(f'reconnect: report counts {report["messages_sent"]} sent and {report["failures"]} failed, expected {message_count} and 0')
+    if report['connections'] != expected_connections:
+        failures.append(f'reconnect: {report["connections"]} connections, expected {expected_connections}')
+
+
+def check_message_failures(logger, relay, port, failures):
+    """Refused recipients and a 5xx on DATA fail that message alone, as permanent failures."""
+    delivered = len(relay.delivered)
+    with app.MailTransport(logger, 'Message failure check', '127.0.0.1', port, 'user', 'password') as transport:
+        for name, distribution_list, email_subject, error_type in (
+            ('refused recipient', [REFUSED_RECIPIENT], 'Refused', smtplib.SMTPRecipientsRefused),
+            ('rejected data', ['user@example.com'], REJECTED_SUBJECT, smtplib.SMTPDataError),
+        ):
+            error = expect_error(failures, name, error_type, lambda: transport.send(distribution_list, email_subject, SENDER_ADDRESS, '<p>Body</p>'))
+            if error is not None and not app.is_permanent_smtp_failure(error):
+                failures.append(f'{name}: {error!r} is not treated as a permanent failure')
+        transport.send(['user@example.com'], 'After failures', SENDER_ADDRESS, '<p>Body</p>')
+        report = transport.report()
+    print(f'message failures: {report}')
+    if (report['messages_sent'], report['failures'], report['connections']) != (1, 2, 1):
+        failures.append(f'message failures: report {report}, expected 1 sent, 2 failed, 1 connection')
+    if len(relay.delivered) != delivered + 1:
+        failures.append('message failures: the message after the failures was not delivered')
+
+
+def check_session_failures(logger, relay, port, failures):
+    """A refused login or sender, or a session dropped twice, raises MailSessionError."""
+    relay.accept_logins = False
+    with app.MailTransport(logger, 'Login check', '127.0.0.1', port, 'user', 'wrong-password') as transport:
+        expect_error(failures, 'refused login', app.MailSessionError, lambda: transport.send(['user@example.com'], 'Login', SENDER_ADDRESS, '<p>Body</p>'))
+    relay.accept_logins = True
+    with app.MailTransport(logger, 'Sender check', '127.0.0.1', port, 'user', 'password') as transport:
+        expect_error(failures, 'refused sender', app.MailSessionError, lambda: transport.send(['user@example.com'], 'Sender', REFUSED_SENDER_ADDRESS, '<p>Body</p>'))
+    relay.drop_every_session = True
+    with app.MailTransport(logger, 'Dropped session check', '127.0.0.1', port, 'user', 'password') as transport:
+        expect_error(failures, 'dropped session', app.MailSessionError, lambda: transport.send(['user@example.com'], 'Dropped', SENDER_ADDRESS, '<p>Body</p>'))
+        report = transport.report()
+    relay.drop_every_session = False
+    print(f'dropped session: {report}')
+    if (report['failures'], report['connections']) != (1, 2):
+        failures.append(f'dropped session: report {report}, expected 1 failure over 2 connections')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.mail_transport', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8025)
+    parser.add_argument('--messages', type=int, default=20)
+    parser.add_argument('--session-limit', type=int, default=5, help='messages the relay accepts per session before a 421')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # aiosmtpd logs a deprecation warning for every login.
+    logging.getLogger('mail.log').setLevel(logging.ERROR)
+    logger = logging.getLogger('mail_transport')
+
+    relay = ScriptedRelay(args.session_limit)
+    controller = Controller(relay, hostname='127.0.0.1', port=args.port, authenticator=relay.authenticate, auth_require_tls=False)
+    controller.start()
+    failures = []
+    try:
+        check_reconnect(logger, relay, args.port, args.messages, failures)
+        check_message_failures(logger, relay, args.port, failures)
+        check_session_failures(logger, relay, args.port, failures)
+    finally:
+        controller.stop()
+
+    for failure in failures:
+        print(failure)
+    if failures:
+        print(f'FAILED: {len(failures)} checks')
+        sys.exit(1)
+    print('OK: MailTransport behaves as expected')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+"""
+End-to-end latency of the App routes and startup on synthetic data, saved as JSON.
+
+Generates users and tasks with benchmarks.data, starts the App on them and drives
+/user/<user_name>, create-task, close, /daily-task-trigger and /weekly-summary through the
+Flask test client, recording p50/p99 latency per route, Users and Tasks startup time and
+peak RSS. Requests go to users drawn with the same skew as the tasks, so heavy users are
+requested most.
+
+By default the App runs against the in-process stand-in in benchmarks.standin, whose rows
+count towards peak RSS. With --mysql it runs against the database in the MYSQL_* variables
+instead, which is EMPTIED and reloaded with the generated data first; point it at a scratch
+database with the tables and procedures from setup.sh.
+
+The background scheduler, change log poller, bcrypt workers and notification workers are
+turned off, so only the requests are measured and no email is sent.
+
+Usage:
+    python -m benchmarks.routes [--users N] [--tasks N] [--skew S] [--output results.json] [--mysql]
+    python -m benchmarks.routes --compare before.json after.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.data import draw_user_numbers, generate_tasks, generate_users, user_cumulative_weights, user_name
+
+import app
+
+MYSQL_LOAD_BATCH_SIZE = 10000
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def latency_summary(latencies):
+    latencies = sorted(latencies)
+    if not latencies:
+        return {'count': 0}
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+    return {
+        'count': len(latencies),
+        'p50_ms': percentile(0.50),
+        'p99_ms': percentile(0.99),
+        'mean_ms': sum(latencies) / len(latencies) * 1000,
+        'max_ms': latencies[-1] * 1000,
+        }
+
+
+def sample_open_tasks(tasks, rng, sample_size, sample):
+    """Pass task rows through, keeping a uniform sample of the open ones as (task_id, user_name)."""
+    open_count = 0
+    for row in tasks:
+        if row[7] == 'open':
+            open_count += 1
+            if len(sample) < sample_size:
+                sample.append((row[0], row[3]))
+            else:
+                slot = rng.randrange(open_count)
+                if slot < sample_size:
+                    sample[slot] = (row[0], row[3])
+        yield row
+
+
+def load_mysql(users, tasks):
+    connection = app.connect(
+        user=os.getenv('MYSQL_USER'),
+        password=os.getenv('MYSQL_PASS'),
+        host=os.getenv('MYSQL_HOST'),
+        database=os.getenv('MYSQL_TASKS_DB'),
+        )
+    try:
+        cursor = connection.cursor()
+        for table in ('change_log', 'notification_outbox', 'tasks', 'users'):
+            cursor.execute(f'delete from {table}')
+        cursor.executemany(
+            'insert into users (user_name, created_at, updated_at, email_address, summary_notification_preference, '
+            'trigger_notification_preference, closed_task_display_count_preference, password_hash) '
+            'values (%s, %s, %s, %s, %s, %s, %s, %s)',
+            list(users),
+            )
+        for batch in app.batched(tasks, MYSQL_LOAD_BATCH_SIZE):
+            cursor.executemany(
+                'insert into tasks (task_id, created_at, updated_at, user_name, task_title, task_description, trigger_date, status) '
+                'values (%s, %s, %s, %s, %s, %s, %s, %s)',
+                batch,
+                )
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+
+
+def time_init(cls, startup_seconds, name):
+    """Record how long each construction of cls takes in startup_seconds[name]."""
+    init = cls.__init__
+
+    def timed_init(self, *args, **kwargs):
+        started = time.perf_counter()
+        init(self, *args, **kwargs)
+        startup_seconds[name] = time.perf_counter() - started
+
+    cls.__init__ = timed_init
+
+
+def log_in(client, name):
+    with client.session_transaction() as session:
+        session['_user_id'] = name
+        session['_fresh'] = True
+
+
+def timed_request(client, method, path, expected_status, **kwargs):
+    started = time.perf_counter()
+    response = client.open(path, method=method, **kwargs)
+    elapsed = time.perf_counter() - started
+    if response.status_code != expected_status:
+        raise RuntimeError(f'{method} {path} returned {response.status_code}, expected {expected_status}')
+    return elapsed
+
+
+def run(args):
+    os.environ['BCRYPT_WORKERS'] = '0'
+    os.environ['TASKS_NOTIFICATION_WORKERS'] = '0'
+    os.environ['TASKS_TRIGGER_SCHEDULER'] = ''
+    os.environ['TASKS_CHANGE_POLL_SECONDS'] = '0'
+    logging.basicConfig(level=logging.WARNING)
+
+    now = datetime.datetime.now().replace(microsecond=0)
+    rng = random.Random(args.seed)
+    open_tasks = []
+    users = generate_users(args.users, now)
+    tasks = sample_open_tasks(generate_tasks(args.tasks, args.users, now, skew=args.skew, seed=args.seed), rng, args.requests, open_tasks)
+
+    load_started = time.perf_counter()
+    if args.mysql:
+        load_mysql(users, tasks)
+    else:
+        from benchmarks.standin import StandInDatabase
+        app.connect = StandInDatabase(users, tasks).connect
+    load_seconds = time.perf_counter() - load_started
+    peak_rss_after_load = peak_rss_mb()
+
+    startup_seconds = {}
+    time_init(app.Users, startup_seconds, 'users')
+    time_init(app.Tasks, startup_seconds, 'tasks')
+    started = time.perf_counter()
+    tasks_app = app.App('Tasks', logging.getLogger('Tasks'), wd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + '/')
+    startup_seconds['app'] = time.perf_counter() - started
+    peak_rss_after_startup = peak_rss_mb()
+
+    client = tasks_app.app.test_client()
+    cumulative_weights = user_cumulative_weights(args.users, args.skew)
+    requested_users = [user_name(user_number) for user_number in draw_user_numbers(rng, cumulative_weights, args.requests)]
+    latencies = {'user_home': [], 'create_task': [], 'close_task': [], 'daily_task_trigger': [], 'weekly_summary': []}
+
+    for name in requested_users:
+        log_in(client, name)
+        latencies['user_home'].append(timed_request(client, 'GET', f'/user/{name}', 200))
+    for name in requested_users:
+        log_in(client, name)
+        latencies['create_task'].append(timed_request(
+            client, 'POST', f'/user/{name}/create-task', 200,
+            data={'task_title': 'Benchmark task', 'task_description': 'Created by benchmarks.routes', 'trigger_date': ''},
+            ))
+    for task_id, name in open_tasks:
+        log_in(client, name)
+        latencies['close_task'].append(timed_request(client, 'GET', f'/task/{task_id}/close', 302))
+    # The first trigger opens every due task; later ones find only what became due since.
+    for _ in range(args.trigger_runs):
+        latencies['daily_task_trigger'].append(timed_request(client, 'GET', '/daily-task-trigger', 202))
+    for _ in range(args.summary_runs):
+        latencies['weekly_summary'].append(timed_request(client, 'GET', '/weekly-summary', 202))
+
+    tasks_app._notification_outbox.stop()
+    tasks_app._password_hasher.shutdown()
+    return {
+        'commit': git_commit(),
+        'created_at': now.isoformat(),
+        'python': platform.python_version(),
+        'database': 'mysql' if args.mysql else 'stand-in',
+        'parameters': {
+            'users': args.users,
+            'tasks': args.tasks,
+            'skew': args.skew,
+            'seed': args.seed,
+            'requests': args.requests,
+            'trigger_runs': args.trigger_runs,
+            'summary_runs': args.summary_runs,
+            'lazy_load_users': int(os.getenv('TASKS_LAZY_LOAD_USERS', '0')),
+            },
+        'load_seconds': load_seconds,
+        'startup_seconds': startup_seconds,
+        'routes': {route: latency_summary(route_latencies) for route, route_latencies in latencies.items()},
+        'peak_rss_mb': {
+            'after_load': peak_rss_after_load,
+            'after_startup': peak_rss_after_startup,
+            'final': peak_rss_mb(),
+            },
+        }
+
+
+def print_results(results):
+    parameters = results['parameters']
+    print(f"{results['database']}, {parameters['users']} users, {parameters['tasks']} tasks, skew {parameters['skew']}, commit {results['commit']}")
+    print(' '.join(f'{name} {seconds:.3f}s' for name, seconds in results['startup_seconds'].items()), '(startup)')
+    print(f'{"route":>20} {"count":>6} {"p50 ms":>9} {"p99 ms":>9} {"mean ms":>9}')
+    for route, summary in results['routes'].items():
+        if summary['count']:
+            print(f"{route:>20} {summary['count']:>6} {summary['p50_ms']:>9.2f} {summary['p99_ms']:>9.2f} {summary['mean_ms']:>9.2f}")
+    print(' '.join(f'{stage} {rss:.0f}MB' for stage, rss in results['peak_rss_mb'].items()), '(peak RSS)')
+
+
+def compare(before_path, after_path):
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+    if before['parameters'] != after['parameters'] or before['database'] != after['database']:
+        print('Warning: the runs used different parameters or databases')
+    rows = [(f'startup {name}', before['startup_seconds'].get(name), seconds) for name, seconds in after['startup_seconds'].items()]
+    for route, summary in after['routes'].items():
+        for stat in ('p50_ms', 'p99_ms'):
+            rows.append((f'{route} {stat}', before['routes'].get(route, {}).get(stat), summary.get(stat)))
+    rows.append(('peak RSS MB', before['peak_rss_mb']['final'], after['peak_rss_mb']['final']))
+    print(f'{"":>30} {"before":>10} {"after":>10} {"change":>8}')
+    for name, before_value, after_value in rows:
+        if before_value is None or after_value is None:
+            continue
+        change = f'{(after_value / before_value - 1) * 100:+.1f}%' if before_value else ''
+        print(f'{name:>30} {before_value:>10.3f} {after_value:>10.3f} {change:>8}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.routes', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--tasks', type=int, default=100000, help='from 1k up to 10M')
+    parser.add_argument('--skew', type=float, default=1.0, help='Zipf exponent of tasks per user; 0 spreads them evenly')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--requests', type=int, default=200, help='requests per user route')
+    parser.add_argument('--trigger-runs', type=int, default=3)
+    parser.add_argument('--summary-runs', type=int, default=1)
+    parser.add_argument('--mysql', action='store_true', help='empty and load the MYSQL_* database instead of the stand-in')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help='compare two result files and exit')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    results = run(args)
+    with open(args.output, 'w') as output_file:
+        json.dump(results, output_file, indent=2)
+    print_results(results)
+    print(f'Saved to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+In-process stand-in for the MySQL database, for benchmarking without a server.
+
+Answers the stored procedures the benchmarked routes call from in-memory rows, with the
+same result columns as mysql/stored_procedures. It keeps no change log, so run the app
+without TASKS_CHANGE_POLL_SECONDS against it. Pass StandInDatabase.connect where the app
+calls mysql.connector.connect.
+"""
+import datetime
+import json
+import threading
+
+TASK_COLUMNS = ('task_id', 'created_at', 'updated_at', 'user_name', 'task_title', 'task_description', 'trigger_date', 'status')
+USER_COLUMNS = ('user_name', 'created_at', 'updated_at', 'email_address', 'summary_notification_preference',
+                'trigger_notification_preference', 'closed_task_display_count_preference', 'password_hash')
+
+_TASK_ID, _CREATED_AT, _UPDATED_AT, _USER_NAME, _TASK_TITLE, _TASK_DESCRIPTION, _TRIGGER_DATE, _STATUS = range(len(TASK_COLUMNS))
+
+
+class StandInResult:
+    def __init__(self, column_names, rows):
+        self.column_names = column_names
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class StandInCursor:
+    def __init__(self, database):
+        self._database = database
+        self._results = []
+
+    def callproc(self, proc, args=()):
+        self._results = self._database.call(proc, args)
+        return args
+
+    def stored_results(self):
+        return iter(self._results)
+
+    def close(self):
+        pass
+
+
+class StandInConnection:
+    def __init__(self, database):
+        self._database = database
+        self._connected = True
+
+    def is_connected(self):
+        return self._connected
+
+    def reconnect(self, *args, **kwargs):
+        self._connected = True
+
+    def cursor(self):
+        return StandInCursor(self._database)
+
+    def close(self):
+        self._connected = False
+
+
+class StandInDatabase:
+    def __init__(self, users, tasks):
+        self._lock = threading.Lock()
+        self._users = {row[0]: list(row) for row in users}
+        self._tasks = {}
+        self._task_ids_by_user = {}
+        self._scheduled_task_ids = set()
+        for row in tasks:
+            self._insert_task(list(row))
+        self._next_task_id = max(self._tasks, default=0) + 1
+        self._next_notification_id = 1
+        self.notifications = []
+
+    def connect(self, **db_args):
+        return StandInConnection(self)
+
+    def call(self, proc, args):
+        handler = getattr(self, f'_{proc}', None)
+        if handler is None:
+            raise NotImplementedError(f'The stand-in database does not implement {proc}')
+        with self._lock:
+            return handler(*args)
+
+    def _insert_task(self, row):
+        self._tasks[row[_TASK_ID]] = row
+        self._task_ids_by_user.setdefault(row[_USER_NAME], []).append(row[_TASK_ID])
+        if row[_STATUS] == 'scheduled':
+            self._scheduled_task_ids.add(row[_TASK_ID])
+
+    def _get_user_info(self):
+        return [StandInResult(USER_COLUMNS, [tuple(row) for row in self._users.values()])]
+
+    def _get_task_info(self):
+        return [StandInResult(TASK_COLUMNS, [tuple(row) for row in self._tasks.values()])]
+
+    def _get_task_info_for_user(self, user_name):
+        rows = [tuple(self._tasks[task_id]) for task_id in self._task_ids_by_user.get(user_name, ())]
+        return [StandInResult(TASK_COLUMNS, rows)]
+
+    def _get_task_info_for_users(self, user_names):
+        rows = [tuple(self._tasks[task_id]) for user_name in json.loads(user_names) for task_id in self._task_ids_by_user.get(user_name, ())]
+        return [StandInResult(TASK_COLUMNS, rows)]
+
+    def _get_task_owner(self, task_id):
+        row = self._tasks.get(int(task_id))
+        return [StandInResult(('user_name',), [(row[_USER_NAME],)] if row else [])]
+
+    def _get_scheduled_tasks(self):
+        rows = [(task_id, self._tasks[task_id][_TRIGGER_DATE]) for task_id in self._scheduled_task_ids]
+        return [StandInResult(('task_id', 'trigger_date'), rows)]
+
+    def _get_task_counts_by_user(self):
+        counts = {}
+        for row in self._tasks.values():
+            key = (row[_USER_NAME], row[_STATUS])
+            counts[key] = counts.get(key, 0) + 1
+        return [StandInResult(('user_name', 'status', 'task_count'), [(*key, count) for key, count in counts.items()])]
+
+    def _get_last_change_id(self):
+        return [StandInResult(('last_change_id',), [(0,)])]
+
+    def _add_task(self, user_name, task_title, task_description, trigger_date, status):
+        now = datetime.datetime.now().replace(microsecond=0)
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self._insert_task([task_id, now, now, user_name, task_title, task_description, trigger_date, status])
+        return [StandInResult(('task_id', 'created_at', 'updated_at'), [(task_id, now, now)])]
+
+    def _close_task(self, status, updated_at, task_id):
+        row = self._tasks[int(task_id)]
+        row[_STATUS], row[_UPDATED_AT] = status, updated_at
+        self._scheduled_task_ids.discard(row[_TASK_ID])
+        return [StandInResult(
+            ('created_at', 'user_name', 'task_title', 'task_description', 'trigger_date'),
+            [(row[_CREATED_AT], row[_USER_NAME], row[_TASK_TITLE], row[_TASK_DESCRIPTION], row[_TRIGGER_DATE])],
+            )]
+
+    def _trigger_due_tasks(self, today, updated_at):
+        triggered = []
+        for task_id in [task_id for task_id in self._scheduled_task_ids if self._tasks[task_id][_TRIGGER_DATE] <= today]:
+            row = self._tasks[task_id]
+            row[_STATUS], row[_TRIGGER_DATE], row[_UPDATED_AT] = 'open', None, updated_at
+            self._scheduled_task_ids.discard(task_id)
+            triggered.append(tuple(row))
+        return [StandInResult(TASK_COLUMNS, triggered)]
+
+    def _enqueue_notification(self, distribution_list, email_subject, body):
+        notification_id = self._next_notification_id
+        self._next_notification_id += 1
+        self.notifications.append((notification_id, distribution_list, email_subject, len(body)))
+        return [StandInResult(('notification_id',), [(notification_id,)])]
+
+    def _claim_notifications(self, batch_size, lease_seconds):
+        # Queued notifications are only counted; nothing is ever claimed for sending.
+        return [StandInResult(('notification_id', 'created_at', 'attempts', 'distribution_list', 'email_subject', 'body'), [])]
@@ -0,0 +1,132 @@
+"""
+Concurrent create/close stress check of the Tasks cache against the stand-in database.
+
+Worker threads each create tasks for a handful of shared users and close tasks that any
+worker created, through one ConnectionPool, as waitress request threads would. Each task is
+closed by exactly one thread, so the database ends in a single well-defined state. Afterwards
+every cached record, the user/status index and the closed-task order must match the
+database rows; a lost update shows up as a mismatch and a non-zero exit status.
+
+Usage:
+    python -m benchmarks.stress [--threads N] [--tasks-per-thread N] [--users N]
+"""
+import argparse
+import datetime
+import logging
+import queue
+import sys
+import threading
+import time
+
+import app
+from benchmarks.data import generate_tasks, generate_users, user_name
+from benchmarks.standin import TASK_COLUMNS, StandInDatabase
+
+
+class NullLogger:
+    def info(self, message):
+        pass
+
+
+def worker(tasks, worker_number, task_count, user_count, created, queued, queued_lock, errors):
+    try:
+        for task_number in range(task_count):
+            tasks.add_task(
+                user_name((worker_number + task_number) % user_count),
+                task_title=f'Stress task {worker_number}-{task_number}',
+                task_description='Created by benchmarks.stress',
+                trigger_date='',
+                )
+            # Close an earlier task, usually one another worker created.
+            try:
+                task_id = created.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                tasks.close_task(task_id)
+            with tasks._lock.read():
+                newest_task_ids = tasks._get_task_ids_for_user(user_name((worker_number + task_number) % user_count), 'open')
+            if newest_task_ids:
+                task_id = max(newest_task_ids)
+                with queued_lock:
+                    if task_id in queued:
+                        continue
+                    queued.add(task_id)
+                created.put(task_id)
+    except Exception as error:
+        errors.append(error)
+
+
+def find_mismatches(tasks, database):
+    """Compare the cache with the database rows; returns a list of readable differences."""
+    rows = database.call('get_task_info', ())[0].fetchall()
+    mismatches = []
+    expected_index = {}
+    expected_closed = {}
+    with tasks._lock.read():
+        if len(tasks.task_info) != len(rows):
+            mismatches.append(f'{len(tasks.task_info)} cached tasks, {len(rows)} in the database')
+        for row in rows:
+            expected = app.TaskRecord(*row)
+            expected_index.setdefault(expected.user_name, {}).setdefault(expected.status, set()).add(expected.task_id)
+            if expected.status == 'closed':
+                expected_closed.setdefault(expected.user_name, []).append(tasks._closed_order_key(expected))
+            cached = tasks.task_info.get(expected.task_id)
+            if cached is None:
+                mismatches.append(f'task {expected.task_id} missing from the cache')
+                continue
+            for column in TASK_COLUMNS:
+                if getattr(cached, column) != getattr(expected, column):
+                    mismatches.append(f'task {expected.task_id} {column}: cached {getattr(cached, column)!r}, database {getattr(expected, column)!r}')
+        expected_index = {name: {status: sorted(task_ids) for status, task_ids in user_index.items()} for name, user_index in expected_index.items()}
+        if tasks._task_index != expected_index:
+            mismatches.append('user/status index differs from the database')
+        if tasks._closed_tasks != {name: sorted(keys) for name, keys in expected_closed.items()}:
+            mismatches.append('closed-task order differs from the database')
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.stress', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--tasks-per-thread', type=int, default=500)
+    parser.add_argument('--users', type=int, default=8)
+    parser.add_argument('--pool-size', type=int, default=8)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    now = datetime.datetime.now().replace(microsecond=0)
+    database = StandInDatabase(generate_users(args.users, now), generate_tasks(args.users * 100, args.users, now))
+    app.connect = database.connect
+    pool = app.ConnectionPool(NullLogger(), {}, pool_size=args.pool_size)
+    tasks = app.Tasks(NullLogger(), pool)
+
+    # Task ids waiting to be closed; queued makes sure none is handed out twice.
+    created = queue.Queue()
+    queued = set()
+    queued_lock = threading.Lock()
+    errors = []
+    threads = [
+        threading.Thread(target=worker, args=(tasks, worker_number, args.tasks_per_thread, args.users, created, queued, queued_lock, errors))
+        for worker_number in range(args.threads)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    operations = args.threads * args.tasks_per_thread
+    print(f'{args.threads} threads, {operations} creates in {elapsed:.2f}s ({operations / elapsed:.0f}/s), pool {pool.stats()}')
+    mismatches = [f'worker failed: {error!r}' for error in errors] + find_mismatches(tasks, database)
+    for mismatch in mismatches[:20]:
+        print(mismatch)
+    if mismatches:
+        print(f'FAILED: {len(mismatches)} mismatches')
+        sys.exit(1)
+    print('OK: cache matches the database')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Per-row cost of rendering a user's task table.
+
+Compares the original renderer (DataFrame apply + iterrows + f-string concatenation with a
+url_for call per row) against the task_table.html macro fed with pre-built row tuples.
+
+Usage:
+    python -m benchmarks.task_table [row_count ...]
+"""
+import datetime
+import os
+import sys
+import timeit
+
+import pandas as pd
+from flask import Flask, get_template_attribute, url_for
+
+from app import task_url_root
+
+TEMPLATE_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+
+
+def make_tasks_df(row_count):
+    created_at = datetime.datetime(2024, 1, 1)
+    return pd.DataFrame(
+        [[
+            created_at + datetime.timedelta(minutes=i),
+            None,
+            'bench_user',
+            f'Task {i}',
+            f'Description of task {i}\r\nwith a second line',
+            None,
+            'open',
+            ] for i in range(row_count)],
+        columns=['created_at', 'updated_at', 'user_name', 'task_title', 'task_description', 'trigger_date', 'status'],
+        index=range(1, row_count + 1),
+        )
+
+
+def render_legacy(tasks_df):
+    tasks_df = tasks_df.copy()
+    tasks_df.loc[:, 'task_description'] = tasks_df.apply(lambda r_: r_['task_description'].replace('\r\n', '<br>'), axis=1)
+    task_html = '''
+        <table cellpadding=1 cellspacing=0>
+            <col width="100">
+            <col width="190">
+            <col width="90">
+            <tr bgcolor="#002060", style="color:white;" align="center">
+                <th>Title</th>
+                <th>Description</th>
+                <th>Created Date</th>
+            </tr>
+        '''
+    for task_id, r_ in tasks_df.sort_values('created_at', ascending=True).iterrows():
+        task_html += f'''
+            <tr>
+                <td><a href="{url_for('/task/<task_id>', task_id=task_id, _external=True)}">{r_['task_title']}</a></td>
+                <td>{r_['task_description']}</td>
+                <td align="center">{r_['created_at'].strftime('%Y-%m-%d')}</td>
+            </tr>
+            '''
+    task_html += '</table>'
+    return task_html
+
+
+def render_macro(tasks):
+    task_rows = [
+        (task_id, task_title, task_description.replace('\r\n', '<br>'), created_at.strftime('%Y-%m-%d'))
+        for task_id, created_at, task_title, task_description in sorted(tasks, key=lambda t_: t_[1])
+        ]
+    task_table = get_template_attribute('task_table.html', 'task_table')
+    return task_table(task_rows, 'Created Date', task_url_root('http://localhost/'))
+
+
+def main(row_counts):
+    app = Flask('benchmark', template_folder=TEMPLATE_FOLDER)
+    app.add_url_rule('/task/<task_id>', endpoint='/task/<task_id>', view_func=lambda task_id: '')
+
+    print(f'{"rows":>8} {"legacy us/row":>14} {"macro us/row":>13} {"speedup":>8}')
+    with app.test_request_context('/'):
+        for row_count in row_counts:
+            tasks_df = make_tasks_df(row_count)
+            tasks = list(zip(tasks_df.index, tasks_df['created_at'], tasks_df['task_title'], tasks_df['task_description']))
+            number = max(1, 2000 // row_count)
+            legacy = min(timeit.repeat(lambda: render_legacy(tasks_df), number=number, repeat=3)) / number
+            macro = min(timeit.repeat(lambda: render_macro(tasks), number=number, repeat=3)) / number
+            print(f'{row_count:>8} {legacy / row_count * 1e6:>14.1f} {macro / row_count * 1e6:>13.1f} {legacy / macro:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000])
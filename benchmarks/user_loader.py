@@ -0,0 +1,96 @@
+"""
+Requests per second through a login_required route, with and without the prebuilt User cache.
+
+Flask-Login calls the user_loader on every authenticated request. The uncached loader
+rebuilds a User from the user record each time, as Users.get_user_for_login used to; the
+cached one is the current Users.get_user_for_login. The route itself does nothing, so the
+difference is the loader's share of per-request overhead.
+
+Usage:
+    python -m benchmarks.user_loader [user_count ...]
+"""
+import datetime
+import sys
+import time
+import timeit
+
+from flask import Flask
+from flask_login import LoginManager, login_required, login_user
+
+from app import User, UserRecord, Users
+
+
+class RowsPool:
+    """Stands in for ConnectionPool, answering get_user_info from prebuilt rows."""
+
+    def __init__(self, column_names, rows):
+        self._column_names = column_names
+        self._rows = rows
+
+    def callproc(self, proc, args=()):
+        return self._column_names, self._rows
+
+
+class NullLogger:
+    def info(self, message):
+        pass
+
+
+def make_users(user_count):
+    created_at = datetime.datetime(2024, 1, 1)
+    rows = [
+        (f'user{i}', created_at, created_at, f'user{i}@example.com', 'weekly:friday', 'email', 5, '$2b$12$' + 'x' * 53)
+        for i in range(user_count)
+        ]
+    return Users(NullLogger(), RowsPool(UserRecord.__slots__, rows))
+
+
+def get_user_for_login_uncached(users, user_name):
+    with users._lock.read():
+        user_record = users.user_info.get(user_name)
+        if user_record is None:
+            return None
+        return User(
+            user_name=user_name,
+            email_address=user_record.email_address,
+            password_hash=user_record.password_hash
+        )
+
+
+def make_app(user_loader):
+    app = Flask('benchmark')
+    app.secret_key = 'benchmark'
+    login_manager = LoginManager()
+    login_manager.init_app(app)
+    login_manager.user_loader(user_loader)
+    app.add_url_rule('/login/<user_name>', endpoint='login', view_func=lambda user_name: str(login_user(user_loader(user_name))))
+    app.add_url_rule('/home', endpoint='home', view_func=login_required(lambda: ''))
+    return app
+
+
+def requests_per_second(app, user_name, duration=1.0):
+    client = app.test_client()
+    client.get(f'/login/{user_name}')
+    requests = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        client.get('/home')
+        requests += 1
+    return requests / (time.perf_counter() - started)
+
+
+def main(user_counts):
+    print(f'{"users":>8} {"uncached us":>12} {"cached us":>10} {"uncached req/s":>15} {"cached req/s":>13}')
+    for user_count in user_counts:
+        users = make_users(user_count)
+        user_name = f'user{user_count // 2}'
+        number = 100000
+        uncached = min(timeit.repeat(lambda: get_user_for_login_uncached(users, user_name), number=number, repeat=3)) / number
+        cached = min(timeit.repeat(lambda: users.get_user_for_login(user_name), number=number, repeat=3)) / number
+        uncached_rps = requests_per_second(make_app(lambda user_name: get_user_for_login_uncached(users, user_name)), user_name)
+        cached_rps = requests_per_second(make_app(users.get_user_for_login), user_name)
+        print(f'{user_count:>8} {uncached * 1e6:>12.2f} {cached * 1e6:>10.2f} {uncached_rps:>15.0f} {cached_rps:>13.0f}')
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 100000])
@@ -0,0 +1,29 @@
+-- Change Log Migration
+-- Adds the change_log table that lets several app processes keep their caches in sync
+
+-- 1. Create the change_log table
+create table change_log (
+    change_id bigint primary key auto_increment
+    , changed_at datetime default now()
+    , entity varchar(20) not null
+    , entity_key varchar(100) not null
+    , operation varchar(20) not null
+    , index idx_change_log_entity (entity, change_id)
+);
+
+-- 2. Drop the stored procedures that now write to change_log
+DROP PROCEDURE IF EXISTS add_task;
+DROP PROCEDURE IF EXISTS close_task;
+DROP PROCEDURE IF EXISTS update_task;
+DROP PROCEDURE IF EXISTS delete_task;
+DROP PROCEDURE IF EXISTS add_user;
+DROP PROCEDURE IF EXISTS update_user;
+DROP PROCEDURE IF EXISTS set_password;
+DROP PROCEDURE IF EXISTS delete_user;
+DROP PROCEDURE IF EXISTS purge_inactive_users;
+
+-- 3. Recreate them, and create the new change log readers, from mysql/stored_procedures:
+--    add_task.sql, close_task.sql, update_task.sql, delete_task.sql, add_user.sql,
+--    update_user.sql, set_password.sql, delete_user.sql, purge_inactive_users.sql,
+--    get_last_change_id.sql, get_change_ids_since.sql, get_task_changes.sql,
+--    get_user_changes.sql
@@ -0,0 +1,18 @@
+-- Delta Load Migration
+-- Lets caches refresh only the rows changed since their last load
+
+-- 1. Stamp every row with updated_at so it can be used as a refresh watermark
+UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL;
+UPDATE users SET updated_at = created_at WHERE updated_at IS NULL;
+ALTER TABLE tasks MODIFY COLUMN updated_at datetime default now();
+ALTER TABLE users MODIFY COLUMN updated_at datetime default now();
+
+-- 2. Index the (updated_at, key) refresh order
+CREATE INDEX idx_tasks_updated_at ON tasks (updated_at, task_id);
+CREATE INDEX idx_users_updated_at ON users (updated_at, user_name);
+
+-- 3. purge_inactive_users now returns the purged user names
+DROP PROCEDURE IF EXISTS purge_inactive_users;
+
+-- 4. Recreate it, and create the delta readers, from mysql/stored_procedures:
+--    purge_inactive_users.sql, get_task_info_since.sql, get_user_info_since.sql
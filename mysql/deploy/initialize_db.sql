@@ -1,3 +1,5 @@
+drop table if exists notification_outbox;
+drop table if exists change_log;
 drop table if exists tasks;
 drop table if exists users;
 
@@ -14,3 +16,29 @@ drop procedure if exists update_user;
 drop procedure if exists get_user_info;
 
 drop procedure if exists purge_inactive_users;
+drop procedure if exists set_password;
+
+drop procedure if exists get_last_change_id;
+drop procedure if exists get_change_ids_since;
+drop procedure if exists get_task_changes;
+drop procedure if exists get_user_changes;
+drop procedure if exists purge_change_log;
+
+drop procedure if exists get_task_info_since;
+drop procedure if exists get_user_info_since;
+
+drop procedure if exists get_task_info_for_user;
+drop procedure if exists get_task_info_for_users;
+drop procedure if exists get_task_owner;
+drop procedure if exists trigger_due_tasks;
+drop procedure if exists get_scheduled_tasks;
+drop procedure if exists get_task_counts_by_user;
+drop procedure if exists add_tasks_bulk;
+drop procedure if exists search_tasks;
+
+drop procedure if exists enqueue_notification;
+drop procedure if exists claim_notifications;
+drop procedure if exists complete_notification;
+drop procedure if exists fail_notification;
+drop procedure if exists release_notifications;
+drop procedure if exists get_notification_outbox_stats;
@@ -0,0 +1,8 @@
+-- Lazy Load Migration
+-- Supports fetching one user's tasks on demand
+
+-- 1. Index scheduled tasks by trigger date for finding due tasks
+CREATE INDEX idx_tasks_status_trigger_date ON tasks (status, trigger_date);
+
+-- 2. Create the per-user readers from mysql/stored_procedures:
+--    get_task_info_for_user.sql, get_task_owner.sql
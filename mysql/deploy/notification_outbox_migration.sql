@@ -0,0 +1,20 @@
+-- Notification Outbox Migration
+-- Adds the durable queue that notification emails are sent from
+
+-- 1. Create the notification_outbox table
+create table notification_outbox (
+    notification_id bigint primary key auto_increment
+    , created_at datetime default now()
+    , distribution_list varchar(1000) not null
+    , email_subject varchar(255) not null
+    , body mediumtext not null
+    , status varchar(20) not null default 'pending'
+    , attempts integer not null default 0
+    , next_attempt_at datetime not null default now()
+    , last_error varchar(1000)
+    , index idx_notification_outbox_status_next_attempt_at (status, next_attempt_at)
+);
+
+-- 2. Create the outbox procedures from mysql/stored_procedures:
+--    enqueue_notification.sql, claim_notifications.sql, complete_notification.sql,
+--    fail_notification.sql, release_notifications.sql, get_notification_outbox_stats.sql
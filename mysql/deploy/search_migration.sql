@@ -0,0 +1,8 @@
+-- Search Migration
+-- Indexes task titles and descriptions for full-text search
+
+-- 1. Add the full-text index (builds over every existing task; can take a while on large tables)
+ALTER TABLE tasks ADD FULLTEXT INDEX idx_tasks_fulltext (task_title, task_description);
+
+-- 2. Create the search procedure from mysql/stored_procedures:
+--    search_tasks.sql
@@ -8,6 +8,8 @@ create procedure add_task (
     , _status varchar(20)
     )
     begin
+
+    declare _task_id integer;
     
     insert into tasks (
         user_name
@@ -23,20 +25,21 @@ create procedure add_task (
             , _status
             )
         ;
+
+    set _task_id = LAST_INSERT_ID();
+
+    insert into change_log (entity, entity_key, operation)
+        values ('task', _task_id, 'upsert')
+        ;
     
-    with
-        cte as (
-            select
-                LAST_INSERT_ID() as latest_task_id
-                )
-            select
-                task_id
-                , created_at
-                , updated_at
-            from tasks
-            join cte
-                on task_id = latest_task_id
-                ;
+    select
+        task_id
+        , created_at
+        , updated_at
+    from tasks
+    where
+        task_id = _task_id
+        ;
     
     end //
 
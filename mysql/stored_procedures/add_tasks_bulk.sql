@@ -0,0 +1,77 @@
+delimiter //
+
+-- _tasks is a JSON array of {"task_title", "task_description", "trigger_date", "status"}
+-- objects, inserted with one multi-row statement.
+create procedure add_tasks_bulk (
+    _user_name varchar(100)
+    , _tasks json
+    )
+    begin
+
+    declare _first_task_id integer;
+
+    start transaction;
+
+    insert into tasks (
+        user_name
+        , task_title
+        , task_description
+        , trigger_date
+        , status
+        )
+    select
+        _user_name
+        , jt.task_title
+        , jt.task_description
+        , jt.trigger_date
+        , jt.status
+    from json_table(
+        _tasks
+        , '$[*]' columns (
+            row_number for ordinality
+            , task_title varchar(280) path '$.task_title'
+            , task_description varchar(10000) path '$.task_description'
+            , trigger_date date path '$.trigger_date'
+            , status varchar(20) path '$.status'
+            )
+        ) as jt
+    order by jt.row_number
+        ;
+
+    -- The first id of the statement. Ids of a multi-row insert can interleave with concurrent
+    -- inserts, so the rows are found by owner from here on; another of the user's new tasks
+    -- caught by this is current too, and logging or returning it again is harmless.
+    set _first_task_id = LAST_INSERT_ID();
+
+    insert into change_log (entity, entity_key, operation)
+    select
+        'task'
+        , task_id
+        , 'upsert'
+    from tasks
+    where
+        user_name = _user_name
+        and task_id >= _first_task_id
+        ;
+
+    commit;
+
+    select
+        task_id
+        , created_at
+        , updated_at
+        , user_name
+        , task_title
+        , task_description
+        , trigger_date
+        , status
+    from tasks
+    where
+        user_name = _user_name
+        and task_id >= _first_task_id
+    order by task_id
+        ;
+    
+    end //
+
+delimiter ;
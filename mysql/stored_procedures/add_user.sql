@@ -26,7 +26,11 @@ create procedure add_user (
             , _password_hash
             )
         ;
-    
+
+    insert into change_log (entity, entity_key, operation)
+        values ('user', _user_name, 'upsert')
+        ;
+
         select
             created_at
             , updated_at
@@ -0,0 +1,54 @@
+delimiter //
+
+create procedure claim_notifications (
+    _limit integer
+    , _lease_seconds integer
+    )
+    begin
+
+    drop temporary table if exists claimed_notifications;
+
+    start transaction;
+
+    -- skip locked lets several workers claim disjoint batches without waiting on each other
+    create temporary table claimed_notifications as
+    select
+        notification_id
+    from notification_outbox
+    where
+        status = 'pending'
+        and next_attempt_at <= now()
+    order by next_attempt_at
+    limit _limit
+    for update skip locked
+        ;
+
+    -- a claim is a lease: if the worker dies, the row becomes due again when it runs out
+    update notification_outbox as n
+    join claimed_notifications as cn
+        on n.notification_id = cn.notification_id
+        set
+            n.attempts = n.attempts + 1
+            , n.next_attempt_at = now() + interval _lease_seconds second
+        ;
+
+    commit;
+
+    select
+        n.notification_id
+        , n.created_at
+        , n.attempts
+        , n.distribution_list
+        , n.email_subject
+        , n.body
+    from notification_outbox as n
+    join claimed_notifications as cn
+        on n.notification_id = cn.notification_id
+    order by n.notification_id
+        ;
+
+    drop temporary table claimed_notifications;
+    
+    end //
+
+delimiter ;
@@ -16,6 +16,10 @@ create procedure close_task (
         task_id = _task_id
         ;
 
+    insert into change_log (entity, entity_key, operation)
+        values ('task', _task_id, 'upsert')
+        ;
+
     select
         created_at, 
         user_name, 
@@ -0,0 +1,15 @@
+delimiter //
+
+create procedure complete_notification (
+    _notification_id bigint
+    )
+    begin
+
+    delete from notification_outbox
+    where
+        notification_id = _notification_id
+        ;
+    
+    end //
+
+delimiter ;
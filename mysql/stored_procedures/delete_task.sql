@@ -11,6 +11,10 @@ create procedure delete_task (
         task_id = _task_id
         ;
 
+    insert into change_log (entity, entity_key, operation)
+        values ('task', _task_id, 'delete')
+        ;
+
     
     end //
 
@@ -11,6 +11,10 @@ create procedure delete_user (
         user_name = _user_name
         ;
 
+    insert into change_log (entity, entity_key, operation)
+        values ('user', _user_name, 'delete')
+        ;
+
     
     end //
 
@@ -0,0 +1,20 @@
+delimiter //
+
+create procedure enqueue_notification (
+    _distribution_list varchar(1000)
+    , _email_subject varchar(255)
+    , _body mediumtext
+    )
+    begin
+
+    insert into notification_outbox (distribution_list, email_subject, body)
+    values (_distribution_list, _email_subject, _body)
+        ;
+
+    select
+        last_insert_id() as notification_id
+        ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,22 @@
+delimiter //
+
+-- A null _retry_at dead-letters the notification; it stays in the table for inspection.
+create procedure fail_notification (
+    _notification_id bigint
+    , _last_error varchar(1000)
+    , _retry_at datetime
+    )
+    begin
+
+    update notification_outbox
+        set
+            status = if(_retry_at is null, 'dead', 'pending')
+            , next_attempt_at = coalesce(_retry_at, next_attempt_at)
+            , last_error = _last_error
+    where
+        notification_id = _notification_id
+        ;
+    
+    end //
+
+delimiter ;
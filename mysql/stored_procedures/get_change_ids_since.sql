@@ -0,0 +1,35 @@
+delimiter //
+
+-- _pending_change_ids is a JSON array of ids at or below _change_id that the caller read
+-- past before they were committed; the ones committed since are returned with the new ids.
+create procedure get_change_ids_since (
+    _change_id bigint
+    , _pending_change_ids json
+    )
+    begin
+
+    select
+        c.change_id
+        , c.entity
+    from change_log as c
+    where
+        c.change_id > _change_id
+    union all
+    select
+        c.change_id
+        , c.entity
+    from json_table(
+        _pending_change_ids
+        , '$[*]' columns (
+            change_id bigint path '$'
+            )
+        ) as p
+    join change_log as c
+        on c.change_id = p.change_id
+    order by
+        change_id
+    ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,13 @@
+delimiter //
+
+create procedure get_last_change_id ()
+    begin
+
+    select
+        coalesce(max(change_id), 0) as last_change_id
+    from change_log
+    ;
+    
+    end //
+
+delimiter ;
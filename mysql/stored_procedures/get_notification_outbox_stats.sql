@@ -0,0 +1,16 @@
+delimiter //
+
+create procedure get_notification_outbox_stats ()
+    begin
+
+    select
+        status
+        , count(*) as notification_count
+        , min(created_at) as oldest_created_at
+    from notification_outbox
+    group by status
+        ;
+    
+    end //
+
+delimiter ;
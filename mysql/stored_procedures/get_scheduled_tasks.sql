@@ -0,0 +1,16 @@
+delimiter //
+
+create procedure get_scheduled_tasks ()
+    begin
+
+    select
+        task_id,
+        trigger_date
+    from tasks
+    where
+        status = 'scheduled'
+    ;
+    
+    end //
+
+delimiter ;
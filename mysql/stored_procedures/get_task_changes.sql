@@ -0,0 +1,38 @@
+delimiter //
+
+-- _change_ids is a JSON array of the change ids to read, from get_change_ids_since.
+create procedure get_task_changes (
+    _change_ids json
+    )
+    begin
+
+    select
+        c.change_id
+        , c.operation
+        , cast(c.entity_key as unsigned) as task_id
+        , t.created_at
+        , t.updated_at
+        , t.user_name
+        , t.task_title
+        , t.task_description
+        , t.trigger_date
+        , t.status
+    from json_table(
+        _change_ids
+        , '$[*]' columns (
+            change_id bigint path '$'
+            )
+        ) as i
+    join change_log as c
+        on c.change_id = i.change_id
+    left join tasks as t
+        on t.task_id = cast(c.entity_key as unsigned)
+    where
+        c.entity = 'task'
+    order by
+        c.change_id
+    ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,18 @@
+delimiter //
+
+create procedure get_task_counts_by_user ()
+    begin
+
+    select
+        user_name
+        , status
+        , count(*) as task_count
+    from tasks
+    group by
+        user_name
+        , status
+    ;
+    
+    end //
+
+delimiter ;
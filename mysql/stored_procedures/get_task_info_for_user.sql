@@ -0,0 +1,24 @@
+delimiter //
+
+create procedure get_task_info_for_user (
+    _user_name varchar(100)
+    )
+    begin
+
+    select
+        task_id
+        , created_at
+        , updated_at
+        , user_name
+        , task_title
+        , task_description
+        , trigger_date
+        , status
+    from tasks
+    where
+        user_name = _user_name
+    ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,30 @@
+delimiter //
+
+-- _user_names is a JSON array of user names, e.g. one batch of weekly summary recipients.
+create procedure get_task_info_for_users (
+    _user_names json
+    )
+    begin
+
+    select
+        t.task_id
+        , t.created_at
+        , t.updated_at
+        , t.user_name
+        , t.task_title
+        , t.task_description
+        , t.trigger_date
+        , t.status
+    from json_table(
+        _user_names
+        , '$[*]' columns (
+            user_name varchar(100) path '$'
+            )
+        ) as u
+    join tasks as t
+        on t.user_name = u.user_name
+    ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,31 @@
+delimiter //
+
+create procedure get_task_info_since (
+    _updated_at datetime
+    , _task_id integer
+    , _limit integer
+    )
+    begin
+
+    select
+        task_id
+        , created_at
+        , updated_at
+        , user_name
+        , task_title
+        , task_description
+        , trigger_date
+        , status
+    from tasks
+    where
+        updated_at > _updated_at
+        or (updated_at = _updated_at and task_id > _task_id)
+    order by
+        updated_at
+        , task_id
+    limit _limit
+    ;
+    
+    end //
+
+delimiter ;
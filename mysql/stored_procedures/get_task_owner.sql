@@ -0,0 +1,17 @@
+delimiter //
+
+create procedure get_task_owner (
+    _task_id integer
+    )
+    begin
+
+    select
+        user_name
+    from tasks
+    where
+        task_id = _task_id
+    ;
+    
+    end //
+
+delimiter ;
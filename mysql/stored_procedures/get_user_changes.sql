@@ -0,0 +1,38 @@
+delimiter //
+
+-- _change_ids is a JSON array of the change ids to read, from get_change_ids_since.
+create procedure get_user_changes (
+    _change_ids json
+    )
+    begin
+
+    select
+        c.change_id
+        , c.operation
+        , c.entity_key as user_name
+        , u.created_at
+        , u.updated_at
+        , u.email_address
+        , u.summary_notification_preference
+        , u.trigger_notification_preference
+        , u.closed_task_display_count_preference
+        , u.password_hash
+    from json_table(
+        _change_ids
+        , '$[*]' columns (
+            change_id bigint path '$'
+            )
+        ) as i
+    join change_log as c
+        on c.change_id = i.change_id
+    left join users as u
+        on u.user_name = c.entity_key
+    where
+        c.entity = 'user'
+    order by
+        c.change_id
+    ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,31 @@
+delimiter //
+
+create procedure get_user_info_since (
+    _updated_at datetime
+    , _user_name varchar(100)
+    , _limit integer
+    )
+    begin
+
+    select
+        user_name
+        , created_at
+        , updated_at
+        , email_address
+        , summary_notification_preference
+        , trigger_notification_preference
+        , closed_task_display_count_preference
+        , password_hash
+    from users
+    where
+        updated_at > _updated_at
+        or (updated_at = _updated_at and user_name > _user_name)
+    order by
+        updated_at
+        , user_name
+    limit _limit
+    ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,31 @@
+delimiter //
+
+-- Deletes change log rows written before _changed_before, 10000 at a time so no single
+-- statement holds locks for long. Rows are in change_id order, so the oldest are found first.
+create procedure purge_change_log (
+    _changed_before datetime
+    )
+    begin
+
+    declare _batch_count integer default 0;
+    declare _deleted_count integer default 0;
+
+    repeat
+        delete from change_log
+        where
+            changed_at < _changed_before
+        order by change_id
+        limit 10000
+            ;
+
+        set _batch_count = row_count();
+        set _deleted_count = _deleted_count + _batch_count;
+    until _batch_count < 10000 end repeat;
+
+    select
+        _deleted_count as deleted_count
+        ;
+    
+    end //
+
+delimiter ;
@@ -5,7 +5,11 @@ create procedure purge_inactive_users ()
     
     set sql_safe_updates = 0;
 
-    delete u 
+    drop temporary table if exists purged_users;
+
+    create temporary table purged_users as
+    select
+        u.user_name
     from users as u
     left join tasks t
         on u.user_name = t.user_name
@@ -13,6 +17,26 @@ create procedure purge_inactive_users ()
         t.user_name is null
         ;
 
+    insert into change_log (entity, entity_key, operation)
+    select
+        'user'
+        , user_name
+        , 'delete'
+    from purged_users
+        ;
+
+    delete u 
+    from users as u
+    join purged_users as p
+        on u.user_name = p.user_name
+        ;
+
+    select
+        user_name
+    from purged_users
+        ;
+
+    drop temporary table purged_users;
     
     end //
 
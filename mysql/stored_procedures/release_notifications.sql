@@ -0,0 +1,27 @@
+delimiter //
+
+-- _notification_ids is a JSON array of claimed notification ids the worker could not try,
+-- e.g. because the SMTP server refused its login. The claim is not counted as an attempt.
+create procedure release_notifications (
+    _notification_ids json
+    )
+    begin
+
+    update notification_outbox as n
+    join json_table(
+        _notification_ids
+        , '$[*]' columns (
+            notification_id bigint path '$'
+            )
+        ) as r
+        on n.notification_id = r.notification_id
+        set
+            n.attempts = greatest(n.attempts - 1, 0)
+            , n.next_attempt_at = now()
+    where
+        n.status = 'pending'
+        ;
+    
+    end //
+
+delimiter ;
@@ -0,0 +1,33 @@
+delimiter //
+
+-- Natural language mode takes the query as plain words, so user input needs no escaping.
+create procedure search_tasks (
+    _user_name varchar(100)
+    , _query varchar(1000)
+    , _status varchar(20)
+    , _limit integer
+    )
+    begin
+
+    select
+        task_id
+        , created_at
+        , updated_at
+        , user_name
+        , task_title
+        , task_description
+        , trigger_date
+        , status
+        , match (task_title, task_description) against (_query in natural language mode) as score
+    from tasks
+    where
+        user_name = _user_name
+        and (_status is null or status = _status)
+        and match (task_title, task_description) against (_query in natural language mode)
+    order by score desc, task_id desc
+    limit _limit
+    ;
+    
+    end //
+
+delimiter ;
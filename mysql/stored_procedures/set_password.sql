@@ -15,6 +15,10 @@ create procedure set_password (
         user_name = _user_name
         ;
 
+    insert into change_log (entity, entity_key, operation)
+        values ('user', _user_name, 'upsert')
+        ;
+
     end //
 
 delimiter ;
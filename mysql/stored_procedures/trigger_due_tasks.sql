@@ -0,0 +1,60 @@
+delimiter //
+
+create procedure trigger_due_tasks (
+    _today date
+    , _updated_at datetime
+    )
+    begin
+
+    drop temporary table if exists triggered_tasks;
+
+    start transaction;
+
+    create temporary table triggered_tasks as
+    select
+        task_id
+    from tasks
+    where
+        status = 'scheduled'
+        and trigger_date <= _today
+    for update
+        ;
+
+    update tasks as t
+    join triggered_tasks as tt
+        on t.task_id = tt.task_id
+        set
+            t.status = 'open'
+            , t.trigger_date = null
+            , t.updated_at = _updated_at
+        ;
+
+    insert into change_log (entity, entity_key, operation)
+    select
+        'task'
+        , task_id
+        , 'upsert'
+    from triggered_tasks
+        ;
+
+    commit;
+
+    select
+        t.task_id
+        , t.created_at
+        , t.updated_at
+        , t.user_name
+        , t.task_title
+        , t.task_description
+        , t.trigger_date
+        , t.status
+    from tasks as t
+    join triggered_tasks as tt
+        on t.task_id = tt.task_id
+        ;
+
+    drop temporary table triggered_tasks;
+    
+    end //
+
+delimiter ;
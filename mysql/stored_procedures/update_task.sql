@@ -21,6 +21,10 @@ create procedure update_task (
         task_id = _task_id
         ;
 
+    insert into change_log (entity, entity_key, operation)
+        values ('task', _task_id, 'upsert')
+        ;
+
     select
         created_at, 
         user_name
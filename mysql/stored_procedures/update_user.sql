@@ -21,6 +21,10 @@ create procedure update_user (
         user_name = _user_name
         ;
 
+    insert into change_log (entity, entity_key, operation)
+        values ('user', _user_name, 'upsert')
+        ;
+
     select
         created_at
     from users
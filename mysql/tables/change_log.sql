@@ -0,0 +1,8 @@
+create table change_log (
+    change_id bigint primary key auto_increment
+    , changed_at datetime default now()
+    , entity varchar(20) not null
+    , entity_key varchar(100) not null
+    , operation varchar(20) not null
+    , index idx_change_log_entity (entity, change_id)
+);
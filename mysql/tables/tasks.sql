@@ -1,7 +1,7 @@
 create table tasks (
     task_id integer primary key auto_increment
     , created_at datetime default now()
-    , updated_at datetime null
+    , updated_at datetime default now()
     , user_name varchar(100) not null
     , task_title varchar(280) not null
     , task_description varchar(10000) null
@@ -11,4 +11,7 @@ create table tasks (
         foreign key (user_name)
         references users(user_name)
         on delete cascade
+    , index idx_tasks_updated_at (updated_at, task_id)
+    , index idx_tasks_status_trigger_date (status, trigger_date)
+    , fulltext index idx_tasks_fulltext (task_title, task_description)
 );
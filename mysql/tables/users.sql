@@ -1,10 +1,11 @@
 create table users (
     user_name varchar(100) primary key unique
     , created_at datetime default now()
-    , updated_at datetime null
+    , updated_at datetime default now()
     , email_address varchar(100) not null
     , summary_notification_preference varchar(20) not null
     , trigger_notification_preference varchar(20) not null
     , closed_task_display_count_preference int not null
     , password_hash varchar(255) null
+    , index idx_users_updated_at (updated_at, user_name)
 );
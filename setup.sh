@@ -8,6 +8,8 @@ mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysq
 
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/tables/users.sql
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/tables/tasks.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/tables/change_log.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/tables/notification_outbox.sql
 
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/add_task.sql
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/close_task.sql
@@ -20,3 +22,24 @@ mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysq
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_user_info.sql
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/purge_inactive_users.sql
 mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/set_password.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_last_change_id.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_change_ids_since.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_task_changes.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_user_changes.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/purge_change_log.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_task_info_since.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_user_info_since.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_task_info_for_user.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_task_info_for_users.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_task_owner.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/trigger_due_tasks.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_scheduled_tasks.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_task_counts_by_user.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/add_tasks_bulk.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/search_tasks.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/enqueue_notification.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/claim_notifications.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/complete_notification.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/fail_notification.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/release_notifications.sql
+mysql -h$MYSQL_HOST -u$MYSQL_USER -p$MYSQL_PASS $MYSQL_TASKS_DB < $base_dir/mysql/stored_procedures/get_notification_outbox_stats.sql